@@ -0,0 +1,313 @@
+import numpy as np
+
+# Samples per internal block of the IIR engine. Within a block the recursion
+# is a matrix product; only the two-sample state is chained between blocks.
+IIR_BLOCK_SIZE = 64
+
+# Smallest FFT used by the FIR overlap-save engine.
+FIR_MIN_FFT = 1024
+
+FILTER_OPERATIONS = {
+    "Low-pass Filter": "lowpass",
+    "High-pass Filter": "highpass",
+    "Band-pass Filter": "bandpass",
+}
+
+
+def _check_frequency(frequency, sample_rate):
+    if not 0 < frequency < sample_rate / 2:
+        raise ValueError("Filter frequencies must lie between 0 and half the sample rate.")
+
+def biquad(kind, frequency, sample_rate, q=1 / np.sqrt(2)):
+    # One second-order section [b0, b1, b2, 1, a1, a2] from the RBJ audio EQ
+    # cookbook. For "bandpass", ``frequency`` is the centre and the peak
+    # gain is 0 dB.
+    _check_frequency(frequency, sample_rate)
+    w0 = 2 * np.pi * frequency / sample_rate
+    alpha = np.sin(w0) / (2 * q)
+    cos_w0 = np.cos(w0)
+    if kind == "lowpass":
+        b = [(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2]
+    elif kind == "highpass":
+        b = [(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2]
+    elif kind == "bandpass":
+        b = [alpha, 0.0, -alpha]
+    else:
+        raise ValueError(f"Unsupported filter type: {kind}")
+    a = [1 + alpha, -2 * cos_w0, 1 - alpha]
+    return np.array(b + a) / a[0]
+
+def butterworth_bandpass_sos(low, high, sample_rate, sections):
+    # Butterworth band-pass with ``sections`` biquads (order 2 * sections):
+    # the analog low-pass prototype of order ``sections`` is mapped to a
+    # band-pass between the prewarped edges, then to z by the bilinear
+    # transform. Each prototype pole becomes a pair of poles with its own
+    # centre and Q, so the sections are staggered rather than identical, and
+    # the response is -3 dB at ``low`` and ``high``.
+    _check_frequency(low, sample_rate)
+    _check_frequency(high, sample_rate)
+    if low >= high:
+        raise ValueError("Band-pass cutoffs must satisfy low < high.")
+    fs2 = 2 * sample_rate
+    w_low, w_high = fs2 * np.tan(np.pi * low / sample_rate), fs2 * np.tan(np.pi * high / sample_rate)
+    bandwidth, w0_squared = w_high - w_low, w_low * w_high
+    prototype = np.exp(1j * np.pi * (2 * np.arange(sections) + sections + 1) / (2 * sections))
+    root = np.sqrt((prototype * bandwidth) ** 2 - 4 * w0_squared + 0j)
+    poles = np.concatenate([(prototype * bandwidth + root) / 2, (prototype * bandwidth - root) / 2])
+    poles = (fs2 + poles) / (fs2 - poles)
+    # One biquad per conjugate pole pair; for very wide bands the real
+    # prototype pole maps to two real poles, which share a biquad. Each
+    # section has zeros at z = 1 and z = -1 and unit gain at the band centre.
+    is_real = np.abs(poles.imag) < 1e-12
+    upper = poles[~is_real & (poles.imag > 0)]
+    real = np.sort(poles[is_real].real).reshape(-1, 2)
+    sos = np.zeros((sections, 6))
+    sos[:, 0], sos[:, 2], sos[:, 3] = 1.0, -1.0, 1.0
+    sos[:, 4] = np.concatenate([-2 * upper.real, -real.sum(axis=1)])
+    sos[:, 5] = np.concatenate([np.abs(upper) ** 2, real.prod(axis=1)])
+    centre = np.exp(1j * 2 * np.arctan(np.sqrt(w0_squared) / fs2))
+    gain = np.abs((1 - centre ** -2) / (1 + sos[:, 4] * centre ** -1 + sos[:, 5] * centre ** -2))
+    sos[:, :3] /= gain[:, None]
+    return sos
+
+def butterworth_sos(kind, cutoff, sample_rate, order=4):
+    # Cascade of biquads for an even-order Butterworth filter. ``cutoff`` is
+    # a frequency for low/high-pass and a (low, high) pair for band-pass.
+    if order < 2 or order % 2:
+        raise ValueError("Filter order must be a positive even number.")
+    sections = order // 2
+    if kind == "bandpass":
+        low, high = cutoff
+        return butterworth_bandpass_sos(low, high, sample_rate, sections)
+    qs = 1 / (2 * np.cos((2 * np.arange(1, sections + 1) - 1) * np.pi / (2 * order)))
+    return np.array([biquad(kind, cutoff, sample_rate, q) for q in qs])
+
+def fir_design(kind, cutoff, sample_rate, num_taps=101):
+    # Hamming-windowed sinc FIR taps. ``cutoff`` is as for butterworth_sos.
+    if num_taps % 2 == 0:
+        raise ValueError("FIR filters need an odd number of taps.")
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    window = np.hamming(num_taps)
+
+    def lowpass(frequency):
+        _check_frequency(frequency, sample_rate)
+        fc = frequency / sample_rate
+        taps = 2 * fc * np.sinc(2 * fc * n) * window
+        return taps / taps.sum()
+
+    if kind == "lowpass":
+        return lowpass(cutoff)
+    elif kind == "highpass":
+        taps = -lowpass(cutoff)
+        taps[num_taps // 2] += 1
+        return taps
+    elif kind == "bandpass":
+        low, high = cutoff
+        return lowpass(high) - lowpass(low)
+    raise ValueError(f"Unsupported filter type: {kind}")
+
+
+class SOSFilter:
+    """Streaming IIR filter made of cascaded second-order sections.
+
+    process() accepts blocks shaped (..., n) - one row per channel - and
+    carries the last two inputs and each section's last two outputs over to
+    the next call, so a long or memory-mapped signal can be filtered piece
+    by piece.
+
+    ``sos`` is (sections, 6), or (..., sections, 6) to give each channel its
+    own coefficients; the leading axes broadcast against the channels, so a
+    single input row filtered by N designs yields N rows in one pass.
+
+    Internally the signal is cut into blocks of ``block_size`` samples. The
+    cascade is linear, so each block's output is a fixed matrix applied to
+    its inputs plus the state entering it; the state recursion between
+    blocks is solved with a log-step prefix scan. Leftover samples shorter
+    than a block run through the plain recursion.
+    """
+
+    def __init__(self, sos, block_size=IIR_BLOCK_SIZE):
+        self.sos = np.asarray(sos, dtype=float)
+        if self.sos.ndim == 1:
+            self.sos = self.sos[None]
+        self.block_size = block_size
+        self.x_state = None
+        self.y_state = None
+        self._build_block_matrices()
+
+    def reset(self):
+        self.x_state = None
+        self.y_state = None
+
+    def _run_direct(self, x, x_state, y_state, sos=None):
+        # Sample-by-sample recursion, vectorized over channels. x_state holds
+        # (x[-1], x[-2]); y_state holds (y[-1], y[-2]) for every section.
+        sos = self.sos if sos is None else sos
+        channels = np.broadcast_shapes(x.shape[:-1], x_state.shape[:-1], y_state.shape[:-2], sos.shape[:-2])
+        out = np.empty(channels + x.shape[-1:])
+        x_state = np.broadcast_to(x_state, channels + (2,)).copy()
+        y_state = np.broadcast_to(y_state, channels + y_state.shape[-2:]).copy()
+        coefficients = [np.moveaxis(sos[..., k, :], -1, 0) for k in range(sos.shape[-2])]
+        for t in range(x.shape[-1]):
+            u = x[..., t]
+            u1, u2 = x_state[..., 0].copy(), x_state[..., 1].copy()
+            x_state[..., 1] = u1
+            x_state[..., 0] = u
+            for k, (b0, b1, b2, _, a1, a2) in enumerate(coefficients):
+                y1, y2 = y_state[..., k, 0].copy(), y_state[..., k, 1].copy()
+                y = b0 * u + b1 * u1 + b2 * u2 - a1 * y1 - a2 * y2
+                y_state[..., k, 1] = y1
+                y_state[..., k, 0] = y
+                u, u1, u2 = y, y1, y2
+            out[..., t] = u
+        return out, x_state, y_state
+
+    def _build_block_matrices(self):
+        # Feed one unit impulse per block input, incoming input pair and
+        # incoming section state through the recursion to read off the map
+        # from (block, x_state, y_state) to (block output, y_state after).
+        # The maps act on row vectors, with the blocks as rows; per-channel
+        # coefficients give a stack of maps that broadcasts over the channels.
+        size = self.block_size
+        sections = self.sos.shape[-2]
+        state_size = 2 * sections
+        cases = size + 2 + state_size
+        basis = np.eye(cases)
+        out, _, y_after = self._run_direct(basis[:, :size], basis[:, size:size + 2],
+                                           basis[:, size + 2:].reshape(cases, sections, 2),
+                                           self.sos[..., None, :, :])
+        y_after = y_after.reshape(y_after.shape[:-2] + (state_size,))
+        self._block_response = out[..., :size, :]
+        self._carry_response = out[..., size:, :]
+        self._block_to_state = y_after[..., :size, :]
+        self._inputs_to_state = y_after[..., size:size + 2, :]
+        self._transition = y_after[..., size + 2:, :]
+
+    def process(self, block):
+        x = np.asarray(block, dtype=float)
+        channels = np.broadcast_shapes(x.shape[:-1], self.sos.shape[:-2])
+        if self.x_state is None:
+            self.x_state = np.zeros(channels + (2,))
+            self.y_state = np.zeros(channels + (self.sos.shape[-2], 2))
+        elif self.x_state.shape[:-1] != channels:
+            raise ValueError("Block channel layout differs from previous blocks.")
+
+        size = self.block_size
+        n = x.shape[-1]
+        whole = n - n % size
+        y = np.empty(channels + (n,))
+        if whole:
+            y[..., :whole] = self._process_blocks(x[..., :whole])
+        y[..., whole:], self.x_state, self.y_state = self._run_direct(x[..., whole:], self.x_state, self.y_state)
+        return y
+
+    def _process_blocks(self, x):
+        size = self.block_size
+        num_blocks = x.shape[-1] // size
+        channels = self.x_state.shape[:-1]
+        blocks = x.reshape(x.shape[:-1] + (num_blocks, size))
+
+        # Inputs x[-1], x[-2] seen by each block come straight from the data.
+        prev_inputs = np.empty(channels + (num_blocks, 2))
+        prev_inputs[..., 0, :] = self.x_state
+        prev_inputs[..., 1:, :] = blocks[..., :-1, [-1, -2]]
+
+        # State leaving block j is W_j + (state entering block j) @ T.
+        y_state = self.y_state.reshape(channels + (-1,))
+        leaving = blocks @ self._block_to_state + prev_inputs @ self._inputs_to_state
+        leaving[..., 0, :] += (y_state[..., None, :] @ self._transition)[..., 0, :]
+        power = self._transition
+        step = 1
+        while step < num_blocks:
+            leaving[..., step:, :] += leaving[..., :-step, :] @ power
+            power = power @ power
+            step *= 2
+        entering = np.concatenate([y_state[..., None, :], leaving[..., :-1, :]], axis=-2)
+
+        y = blocks @ self._block_response
+        y = y + np.concatenate([prev_inputs, entering], axis=-1) @ self._carry_response
+
+        self.x_state = np.broadcast_to(x[..., [-1, -2]], channels + (2,)).copy()
+        self.y_state = leaving[..., -1, :].reshape(self.y_state.shape)
+        return y.reshape(channels + (-1,))
+
+
+class FIRFilter:
+    """Streaming FIR filter using FFT overlap-save.
+
+    Like SOSFilter, process() takes (..., n) blocks and keeps the last
+    ``len(taps) - 1`` inputs of each channel between calls.
+    """
+
+    def __init__(self, taps):
+        self.taps = np.asarray(taps, dtype=float)
+        history = len(self.taps) - 1
+        self.fft_size = max(FIR_MIN_FFT, 1 << int(np.ceil(np.log2(8 * len(self.taps)))))
+        self.step = self.fft_size - history
+        self._response = np.fft.rfft(self.taps, self.fft_size)
+        self.state = None
+
+    def reset(self):
+        self.state = None
+
+    def process(self, block):
+        x = np.asarray(block, dtype=float)
+        history = len(self.taps) - 1
+        if self.state is None:
+            self.state = np.zeros(x.shape[:-1] + (history,))
+        elif self.state.shape[:-1] != x.shape[:-1]:
+            raise ValueError("Block channel layout differs from previous blocks.")
+        n = x.shape[-1]
+        extended = np.concatenate([self.state, x], axis=-1)
+        self.state = extended[..., extended.shape[-1] - history:].copy()
+        if n == 0:
+            return x.copy()
+
+        num_segments = -(-n // self.step)
+        padded_length = (num_segments - 1) * self.step + self.fft_size
+        extended = np.pad(extended, [(0, 0)] * (x.ndim - 1) + [(0, padded_length - extended.shape[-1])])
+        segments = np.lib.stride_tricks.sliding_window_view(extended, self.fft_size, axis=-1)[..., ::self.step, :]
+        filtered = np.fft.irfft(np.fft.rfft(segments, axis=-1) * self._response, self.fft_size, axis=-1)
+        y = filtered[..., history:]
+        return y.reshape(y.shape[:-2] + (-1,))[..., :n]
+
+
+def filter_in_chunks(filt, source, out=None, chunk_size=1 << 20):
+    # Run ``filt`` over ``source`` (any array-like, e.g. a np.memmap) along
+    # its last axis, one chunk at a time, writing into ``out``.
+    if out is None:
+        out = np.empty(source.shape)
+    for start in range(0, source.shape[-1], chunk_size):
+        out[..., start:start + chunk_size] = filt.process(source[..., start:start + chunk_size])
+    return out
+
+def make_filter(kind, cutoff, sample_rate, order=4, design="iir", num_taps=101):
+    if design == "iir":
+        return SOSFilter(butterworth_sos(kind, cutoff, sample_rate, order))
+    elif design == "fir":
+        return FIRFilter(fir_design(kind, cutoff, sample_rate, num_taps))
+    raise ValueError(f"Unsupported filter design: {design}")
+
+def band_edges(kind, frequency):
+    # Cutoff argument for the GUI's single frequency parameter: the
+    # band-pass filter passes one octave centred on ``frequency``.
+    if kind == "bandpass":
+        return frequency / np.sqrt(2), frequency * np.sqrt(2)
+    return frequency
+
+def filter_operation(operation, samples, frequency, sample_rate, order=4):
+    # Apply one of FILTER_OPERATIONS. ``frequency`` may be an array that
+    # broadcasts against the leading axes of ``samples`` (as in sweeps), in
+    # which case each row is filtered with its own cutoff.
+    kind = FILTER_OPERATIONS[operation]
+    samples = np.asarray(samples, dtype=float)
+    if np.ndim(frequency) == 0:
+        return make_filter(kind, band_edges(kind, float(frequency)), sample_rate, order).process(samples)
+    # One design per distinct cutoff, stacked per row, then a single pass of
+    # one SOSFilter over all rows.
+    frequency = np.asarray(frequency, dtype=float)
+    shape = np.broadcast_shapes(frequency.shape[:-1] + samples.shape[-1:], samples.shape)
+    cutoffs = np.broadcast_to(frequency, shape[:-1] + (1,))[..., 0]
+    values, inverse = np.unique(cutoffs, return_inverse=True)
+    designs = np.array([butterworth_sos(kind, band_edges(kind, value), sample_rate, order) for value in values])
+    return SOSFilter(designs[inverse.reshape(cutoffs.shape)]).process(samples)
@@ -1,29 +1,74 @@
 from tkinter import Tk, Label, Button, StringVar, OptionMenu, Frame, DoubleVar, IntVar, Canvas, Scrollbar, filedialog, messagebox, BooleanVar, Checkbutton
+import gc
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backend_bases import MouseEvent
-
-
-plt.style.use('dark_background')
-
-# Neon Dark Theme (unchanged)
-NEON_DARK_THEME = {
-    "BG_COLOR": "#101014",
-    "PANEL_COLOR": "#181820",
-    "ACCENT_COLOR": "#C9E819",
-    "TEXT_COLOR": "#00FFFF",
-    "BTN_COLOR": "#53C4F1",
-    "BTN_TEXT_COLOR": "#101014",
-    "SIGNAL1_COLOR": "#B4C6F5",
-    "SIGNAL2_COLOR": "#F9CC98",
-    "RESULT_COLOR": "#39FF14",
-    "SLIDER_BG": "#222233",
-}
 
-DARK_THEME = NEON_DARK_THEME
+from filters import FILTER_OPERATIONS, filter_operation
+from history import ParameterHistory, ResultStore, params_to_snapshot, snapshot_to_params
+from measurements import measure
+from session import load_session, save_session
+from signals import generate_signal
+from themes import DARK_THEME
+from utils import StartupTimer
+
+# matplotlib and its TkAgg backend dominate cold-start time, so they are
+# imported by load_matplotlib() the first time a figure is needed.
+matplotlib = None
+Figure = None
+FigureCanvasTkAgg = None
+LineCollection = None
+Line2D = None
+setp = None
+
+# Delay before the plot area is built, giving Tk time to map the window first.
+PLOT_AREA_DELAY_MS = 50
+
+# Undo history: a parameter change is recorded once it has been left alone
+# this long, so dragging a slider makes one entry rather than dozens.
+HISTORY_COMMIT_DELAY_MS = 400
+HISTORY_LENGTH = 100
+RESULT_STORE_SIZE = 32
+
+
+def load_matplotlib():
+    global matplotlib, Figure, FigureCanvasTkAgg, LineCollection, Line2D, setp
+    if matplotlib is None:
+        import matplotlib as mpl
+        import matplotlib.style as mpl_style  # registers matplotlib.style
+        from matplotlib.artist import setp as mpl_setp
+        from matplotlib.collections import LineCollection as MplLineCollection
+        from matplotlib.figure import Figure as MplFigure
+        from matplotlib.lines import Line2D as MplLine2D
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as TkCanvas
+        Figure, FigureCanvasTkAgg, setp = MplFigure, TkCanvas, mpl_setp
+        LineCollection, Line2D = MplLineCollection, MplLine2D
+        matplotlib = mpl
+    return matplotlib
+
+def parse_overlay_values(text):
+    # Parameter values for overlay mode: comma- or space-separated numbers,
+    # where "start:stop:count" expands to evenly spaced values. Tokens that
+    # do not parse (e.g. while still being typed) are skipped.
+    values = []
+    for token in text.replace(",", " ").split():
+        try:
+            if ":" in token:
+                start, stop, count = token.split(":")
+                values.extend(np.linspace(float(start), float(stop), int(count)))
+            else:
+                values.append(float(token))
+        except ValueError:
+            continue
+    return np.array(values, dtype=float)
+
+# Operations whose parameter slider can be overlaid with several values
+OVERLAY_OPERATIONS = ["Time Scaling", "Amplitude Scaling", "Time Shifting"] + list(FILTER_OPERATIONS)
+
+# Signals given a full entry in the measurements panel; any further overlay
+# traces are summarised in one line.
+MEASUREMENT_ENTRIES = 4
 
 OPERATION_FORMULAS = {
     "Time Scaling": "x(at)",
@@ -31,17 +76,28 @@ OPERATION_FORMULAS = {
     "Time Shifting": "x(t - t₀)",
     "Time Reversal": "x(-t)",
     "Signal Addition": "x₁(t) + x₂(t) + ...",
-    "Signal Multiplication": "x₁(t) · x₂(t) · ..."
+    "Signal Multiplication": "x₁(t) · x₂(t) · ...",
+    "Low-pass Filter": "h_LP(t) ∗ x(t)",
+    "High-pass Filter": "h_HP(t) ∗ x(t)",
+    "Band-pass Filter": "h_BP(t) ∗ x(t)"
 }
 
 class SignalGUI:
-    def __init__(self, master):
+    def __init__(self, master, timer=None):
         self.master = master
         self.theme = DARK_THEME
-        self.apply_theme()
+        self.timer = timer or StartupTimer()
         self.master.title("WaveLab")
         self.master.configure(bg=self.theme["BG_COLOR"])
 
+        with self.timer.phase("build controls"):
+            self.build_controls(master)
+
+        # The figure is built once the window is on screen (or on first plot).
+        self.figure = None
+        self.master.after(PLOT_AREA_DELAY_MS, self.ensure_plot_area)
+
+    def build_controls(self, master):
         # Title
         title_label = Label(master, text="WaveLab", font=("Segoe Script", 65, "bold"),
                             fg=self.theme["ACCENT_COLOR"], bg=self.theme["BG_COLOR"])
@@ -120,6 +176,9 @@ class SignalGUI:
         master.bind_all("<MouseWheel>", on_mousewheel)
         master.bind_all("<Button-4>", on_linux_scroll)
         master.bind_all("<Button-5>", on_linux_scroll)
+        master.bind_all("<Control-z>", lambda event: self.undo())
+        master.bind_all("<Control-y>", lambda event: self.redo())
+        master.bind_all("<Control-Shift-Z>", lambda event: self.redo())
 
         # Signal 1 controls
         self.signal_type = StringVar(master, "Sine")
@@ -150,28 +209,13 @@ class SignalGUI:
         menu = operation_menu["menu"]
         menu.config(font=("Helvetica Neue", 15))
 
-        # Signal 2 controls (for addition/multiplication)
-        self.signal2_frame = Frame(control_frame, bg=self.theme["PANEL_COLOR"])
-        Label(self.signal2_frame, text="Signal 2 Type", bg=self.theme["PANEL_COLOR"], fg=self.theme["TEXT_COLOR"], font=("Helvetica Neue", 16, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
+        # Signal 2 controls (for addition/multiplication), built on first use
+        self.control_frame = control_frame
+        self.signal2_frame = None
         self.signal2_type = StringVar(master, "Sine")
-        signal2_type_menu = OptionMenu(self.signal2_frame, self.signal2_type, "Sine", "Square", "Sawtooth", "Step", "Impulse", "Ramp")
-        signal2_type_menu.pack(fill="x", padx=15, pady=5)
-        signal2_type_menu.config(font=("Helvetica Neue", 14))
-        menu = signal2_type_menu["menu"]
-        menu.config(font=("Helvetica Neue", 15))
-
         self.amp2_var = DoubleVar(value=1.0)
-        self.amp2_label = self.add_slider(self.signal2_frame, "Amplitude", self.amp2_var, 0.1, 5.0, 0.1, self.theme["SIGNAL1_COLOR"])
-
         self.freq2_var = DoubleVar(value=1.0)
-        self.freq2_label = self.add_slider(self.signal2_frame, "Frequency", self.freq2_var, 1.0, 20.0, 1.0, self.theme["SIGNAL2_COLOR"])
-
         self.phase2_var = DoubleVar(value=0.0)
-        phase2_frame = Frame(self.signal2_frame, bg=self.theme["PANEL_COLOR"])
-        phase2_frame.pack(fill="x", padx=15, pady=(10, 0))
-        Label(phase2_frame, text="Phase (°):", bg=self.theme["PANEL_COLOR"], fg=self.theme["RESULT_COLOR"], font=("Helvetica Neue", 14, "bold")).pack(side="left")
-        phase2_entry = tk.Entry(phase2_frame, textvariable=self.phase2_var, font=("Helvetica Neue", 14), width=8, bg=self.theme["BG_COLOR"], fg=self.theme["RESULT_COLOR"])
-        phase2_entry.pack(side="left", padx=(10, 0))
 
         # Parameter slider
         self.param_var = DoubleVar(value=1.0)
@@ -194,9 +238,20 @@ class SignalGUI:
                                        font=("Helvetica Neue", 16, "bold"), command=self.toggle_discrete_controls)
         discrete_check.pack(side="left")
 
-        self.samples_frame = Frame(control_frame, bg=self.theme["PANEL_COLOR"])
+        # Overlay: plot the processed signal for several parameter values at once
+        overlay_frame = Frame(control_frame, bg=self.theme["PANEL_COLOR"])
+        overlay_frame.pack(fill="x", padx=15, pady=(5, 5))
+        self.overlay_var = BooleanVar(value=False)
+        Checkbutton(overlay_frame, text="OVERLAY", variable=self.overlay_var,
+                    bg=self.theme["PANEL_COLOR"], fg=self.theme["TEXT_COLOR"],
+                    selectcolor=self.theme["BG_COLOR"], activebackground=self.theme["PANEL_COLOR"],
+                    font=("Helvetica Neue", 16, "bold")).pack(side="left")
+        self.overlay_values_var = StringVar(master, "0.5, 1, 2")
+        tk.Entry(overlay_frame, textvariable=self.overlay_values_var, font=("Helvetica Neue", 14), width=14,
+                 bg=self.theme["BG_COLOR"], fg=self.theme["RESULT_COLOR"]).pack(side="left", padx=(10, 0), fill="x", expand=True)
+
+        self.samples_frame = None
         self.samples_var = IntVar(value=50)
-        self.samples_label = self.add_slider(self.samples_frame, "Number of Samples", self.samples_var, 10, 200, 1, self.theme["ACCENT_COLOR"])
 
         # Process and show buttons
         self.process_button = Button(control_frame, text="Process Signal", font=("Helvetica Neue", 18, "bold"),
@@ -210,26 +265,44 @@ class SignalGUI:
 
         self.save_button = Button(control_frame, text="Save This Plot", font=("Helvetica Neue", 16, "bold"),
                                   command=self.save_main_plot, bg="#EC49D4", fg=self.theme["BTN_TEXT_COLOR"], relief="flat")
-        self.save_button.pack(pady=(0, 20), fill="x", padx=15)
+        self.save_button.pack(pady=(0, 10), fill="x", padx=15)
+
+        # Session files: parameters, history and (optionally) computed results
+        session_frame = Frame(control_frame, bg=self.theme["PANEL_COLOR"])
+        session_frame.pack(pady=(0, 20), fill="x", padx=15)
+        self.save_session_button = Button(session_frame, text="Save Session", font=("Helvetica Neue", 14, "bold"),
+                                          command=self.save_session, bg=self.theme["RESULT_COLOR"], fg=self.theme["BTN_TEXT_COLOR"], relief="flat")
+        self.save_session_button.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        self.load_session_button = Button(session_frame, text="Load Session", font=("Helvetica Neue", 14, "bold"),
+                                          command=self.load_session, bg=self.theme["RESULT_COLOR"], fg=self.theme["BTN_TEXT_COLOR"], relief="flat")
+        self.load_session_button.pack(side="left", fill="x", expand=True, padx=(5, 0))
 
         # Reset button
         self.reset_button = Button(control_frame, text="Reset to Default", font=("Helvetica Neue", 14, "bold"),
                                   command=self.reset_parameters, bg=self.theme["ACCENT_COLOR"], fg=self.theme["BTN_TEXT_COLOR"])
         self.reset_button.pack(pady=(0, 20), fill="x", padx=15)
 
+        # Measurements of the plotted signals over the visible x-range
+        Label(control_frame, text="Measurements", bg=self.theme["PANEL_COLOR"], fg=self.theme["TEXT_COLOR"], font=("Helvetica Neue", 16, "bold")).pack(anchor="w", padx=15, pady=(0, 5))
+        self.measurements_label = Label(control_frame, text="Process a signal to measure it.", bg=self.theme["PANEL_COLOR"], fg=self.theme["RESULT_COLOR"],
+                                        font=("Courier", 12), justify="left", anchor="w")
+        self.measurements_label.pack(fill="x", padx=15, pady=(0, 20))
+        self.measured_signals = []
+
 
         # Right panel - Plots
         self.plot_frame = Frame(main_frame, bg=self.theme["PANEL_COLOR"], highlightbackground="#222233", highlightthickness=1) # <-- FIX 1
         self.plot_frame.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
 
-        self.figure, self.axs = plt.subplots(1, 1, figsize=(6, 6))
-        self.figure.patch.set_facecolor(self.theme["PANEL_COLOR"])
-        self.canvas_plot = FigureCanvasTkAgg(self.figure, master=self.plot_frame) # <-- FIX 2
-        self.canvas_plot.get_tk_widget().pack(fill="both", expand=True)
-
         self.last_operation = None
         self.last_params = None
 
+        self.history = ParameterHistory(maxlen=HISTORY_LENGTH)
+        self.results = ResultStore(maxsize=RESULT_STORE_SIZE)
+        self.session = None
+        self._history_commit = None
+        self._restoring = False
+
         self.amp1_var.trace_add("write", lambda *args: self.dynamic_update())
         self.freq1_var.trace_add("write", lambda *args: self.dynamic_update())
         self.phase1_var.trace_add("write", lambda *args: self.dynamic_update())
@@ -242,6 +315,8 @@ class SignalGUI:
         self.operation_type.trace_add("write", lambda *args: self.dynamic_update())
         self.is_discrete_var.trace_add("write", lambda *args: self.dynamic_update())
         self.samples_var.trace_add("write", lambda *args: self.dynamic_update())
+        self.overlay_var.trace_add("write", lambda *args: self.dynamic_update())
+        self.overlay_values_var.trace_add("write", lambda *args: self.dynamic_update())
 
         self.update_parameter_controls(self.operation_type.get())
         self.toggle_discrete_controls()
@@ -251,13 +326,29 @@ class SignalGUI:
         self._dragging = False
         self._drag_start = None
 
+    def ensure_plot_area(self):
+        if self.figure is not None:
+            return
+        with self.timer.phase("import matplotlib"):
+            load_matplotlib()
+            self.apply_theme()
+        with self.timer.phase("build figure"):
+            self.figure = Figure(figsize=(6, 6))
+            self.axs = self.figure.subplots(1, 1)
+            self.figure.patch.set_facecolor(self.theme["PANEL_COLOR"])
+            self.canvas_plot = FigureCanvasTkAgg(self.figure, master=self.plot_frame) # <-- FIX 2
+            self.canvas_plot.get_tk_widget().pack(fill="both", expand=True)
+        with self.timer.phase("first draw"):
+            self.canvas_plot.draw()
+        self.timer.report()
+
     def apply_theme(self):
-        plt.style.use('dark_background')
-        plt.rcParams['axes.labelcolor'] = self.theme["TEXT_COLOR"]
-        plt.rcParams['xtick.color'] = self.theme["TEXT_COLOR"]
-        plt.rcParams['ytick.color'] = self.theme["TEXT_COLOR"]
-        plt.rcParams['axes.edgecolor'] = self.theme["ACCENT_COLOR"]
-        plt.rcParams['axes.titlecolor'] = self.theme["ACCENT_COLOR"]
+        matplotlib.style.use('dark_background')
+        matplotlib.rcParams['axes.labelcolor'] = self.theme["TEXT_COLOR"]
+        matplotlib.rcParams['xtick.color'] = self.theme["TEXT_COLOR"]
+        matplotlib.rcParams['ytick.color'] = self.theme["TEXT_COLOR"]
+        matplotlib.rcParams['axes.edgecolor'] = self.theme["ACCENT_COLOR"]
+        matplotlib.rcParams['axes.titlecolor'] = self.theme["ACCENT_COLOR"]
 
     def add_slider(self, parent, text, var, frm, to, step, color):
         frame = Frame(parent, bg=self.theme["PANEL_COLOR"])
@@ -278,14 +369,39 @@ class SignalGUI:
         slider.pack(side="right", fill="x", expand=True)
         return lbl
 
+    def build_signal2_frame(self):
+        self.signal2_frame = Frame(self.control_frame, bg=self.theme["PANEL_COLOR"])
+        Label(self.signal2_frame, text="Signal 2 Type", bg=self.theme["PANEL_COLOR"], fg=self.theme["TEXT_COLOR"], font=("Helvetica Neue", 16, "bold")).pack(anchor="w", padx=15, pady=(15, 5))
+        signal2_type_menu = OptionMenu(self.signal2_frame, self.signal2_type, "Sine", "Square", "Sawtooth", "Step", "Impulse", "Ramp")
+        signal2_type_menu.pack(fill="x", padx=15, pady=5)
+        signal2_type_menu.config(font=("Helvetica Neue", 14))
+        menu = signal2_type_menu["menu"]
+        menu.config(font=("Helvetica Neue", 15))
+
+        self.amp2_label = self.add_slider(self.signal2_frame, "Amplitude", self.amp2_var, 0.1, 5.0, 0.1, self.theme["SIGNAL1_COLOR"])
+        self.freq2_label = self.add_slider(self.signal2_frame, "Frequency", self.freq2_var, 1.0, 20.0, 1.0, self.theme["SIGNAL2_COLOR"])
+
+        phase2_frame = Frame(self.signal2_frame, bg=self.theme["PANEL_COLOR"])
+        phase2_frame.pack(fill="x", padx=15, pady=(10, 0))
+        Label(phase2_frame, text="Phase (°):", bg=self.theme["PANEL_COLOR"], fg=self.theme["RESULT_COLOR"], font=("Helvetica Neue", 14, "bold")).pack(side="left")
+        phase2_entry = tk.Entry(phase2_frame, textvariable=self.phase2_var, font=("Helvetica Neue", 14), width=8, bg=self.theme["BG_COLOR"], fg=self.theme["RESULT_COLOR"])
+        phase2_entry.pack(side="left", padx=(10, 0))
+
+    def build_samples_frame(self):
+        self.samples_frame = Frame(self.control_frame, bg=self.theme["PANEL_COLOR"])
+        self.samples_label = self.add_slider(self.samples_frame, "Number of Samples", self.samples_var, 10, 200, 1, self.theme["ACCENT_COLOR"])
+
     def update_parameter_controls(self, operation):
-        self.signal2_frame.pack_forget()
+        if self.signal2_frame is not None:
+            self.signal2_frame.pack_forget()
         self.param_label.pack_forget()
         self.param_slider.pack_forget()
 
         before_formula = self.formula_label
 
         if operation in ["Signal Addition", "Signal Multiplication"]:
+            if self.signal2_frame is None:
+                self.build_signal2_frame()
             self.signal2_frame.pack(before=before_formula, fill="x", pady=5)
 
         param_controls_to_show = []
@@ -302,6 +418,10 @@ class SignalGUI:
             self.param_label.config(text=f"Shift (t₀): {self.param_var.get():.2f}")
             self.param_slider.config(from_=-5.0, to=5.0)
             param_controls_to_show = [self.param_label, self.param_slider]
+        elif operation in FILTER_OPERATIONS:
+            self.param_label.config(text=f"{self.filter_param_name(operation)}: {self.param_var.get():.2f} Hz")
+            self.param_slider.config(from_=0.5, to=50.0)
+            param_controls_to_show = [self.param_label, self.param_slider]
 
         for widget in param_controls_to_show:
             if widget == self.param_label:
@@ -319,13 +439,31 @@ class SignalGUI:
                 self.param_label.config(text=f"Scaling factor (a): {val:.2f}")
             elif operation == "Amplitude Scaling":
                 self.param_label.config(text=f"Amplitude (A): {val:.2f}")
+            elif operation in FILTER_OPERATIONS:
+                self.param_label.config(text=f"{self.filter_param_name(operation)}: {val:.2f} Hz")
 
         self.param_slider.config(command=update_label)
 
+    def filter_param_name(self, operation):
+        return "Centre (f₀)" if operation == "Band-pass Filter" else "Cutoff (f_c)"
+
+    def filter_cutoff(self, operation, t, frequency):
+        # The cutoff actually applied: the slider value kept below Nyquist
+        # for coarse discrete grids.
+        sample_rate = (len(t) - 1) / (t[-1] - t[0])
+        limit = 0.45 * sample_rate / (np.sqrt(2) if operation == "Band-pass Filter" else 1)
+        return np.clip(frequency, 0.5, limit)
+
+    def apply_filter(self, operation, samples, t, frequency):
+        sample_rate = (len(t) - 1) / (t[-1] - t[0])
+        return filter_operation(operation, samples, self.filter_cutoff(operation, t, frequency), sample_rate)
+
     def toggle_discrete_controls(self):
         if self.is_discrete_var.get():
+            if self.samples_frame is None:
+                self.build_samples_frame()
             self.samples_frame.pack(before=self.process_button, fill="x", pady=5)
-        else:
+        elif self.samples_frame is not None:
             self.samples_frame.pack_forget()
 
     def process_signal(self):
@@ -350,11 +488,127 @@ class SignalGUI:
         }
 
     def dynamic_update(self):
-        if self.last_operation is not None:
+        if self.last_operation is not None and not self._restoring:
             self.plot_current_signal()
 
     def plot_current_signal(self):
         params = self.get_current_params()
+        if self.overlay_var.get() and params["operation"] in OVERLAY_OPERATIONS:
+            values = parse_overlay_values(self.overlay_values_var.get())
+            if len(values):
+                t_input, s1, t_processed, processed, s2 = self.compute_overlay(params, values)
+                if params["operation"] in FILTER_OPERATIONS:
+                    values = self.filter_cutoff(params["operation"], t_input, values)
+                labels = [f"{self.param_symbol(params['operation'])}={value:g}" for value in values]
+                self.plot_signals(t_input, s1, t_processed, processed, s2, params["is_discrete"], labels)
+                self.schedule_history_commit()
+                return
+        snapshot = params_to_snapshot(params)
+        signals = self.results.get(snapshot)
+        if signals is None and self.session is not None:
+            signals = self.session.result(snapshot)
+        if signals is None:
+            signals = self.compute_signals(params)
+            self.results.put(snapshot, signals)
+        self.plot_signals(*signals, params["is_discrete"])
+        self.schedule_history_commit()
+
+    def schedule_history_commit(self):
+        if self._history_commit is not None:
+            self.master.after_cancel(self._history_commit)
+        self._history_commit = self.master.after(HISTORY_COMMIT_DELAY_MS, self.commit_history)
+
+    def commit_history(self):
+        if self._history_commit is not None:
+            self.master.after_cancel(self._history_commit)
+            self._history_commit = None
+        self.history.record(params_to_snapshot(self.get_current_params()))
+
+    def undo(self):
+        if self.last_operation is None:
+            return
+        self.commit_history()
+        snapshot = self.history.undo()
+        if snapshot is not None:
+            self.restore_snapshot(snapshot)
+
+    def redo(self):
+        if self.last_operation is None:
+            return
+        self.commit_history()
+        snapshot = self.history.redo()
+        if snapshot is not None:
+            self.restore_snapshot(snapshot)
+
+    def restore_snapshot(self, snapshot):
+        # Put the controls back to ``snapshot`` without triggering a redraw
+        # per variable, then plot once (normally straight from the result store).
+        params = snapshot_to_params(snapshot)
+        self._restoring = True
+        try:
+            self.signal_type.set(params["signal_type"])
+            self.amp1_var.set(params["amp1"])
+            self.freq1_var.set(params["freq1"])
+            self.phase1_var.set(params["phase1"])
+            self.signal2_type.set(params["signal2_type"])
+            self.amp2_var.set(params["amp2"])
+            self.freq2_var.set(params["freq2"])
+            self.phase2_var.set(params["phase2"])
+            self.operation_type.set(params["operation"])
+            self.param_var.set(params["param"])
+            self.is_discrete_var.set(params["is_discrete"])
+            self.samples_var.set(params["samples"])
+            self.update_parameter_controls(params["operation"])
+            self.toggle_discrete_controls()
+        finally:
+            self._restoring = False
+        self.refresh_slider_labels()
+        self.last_operation = params["operation"]
+        self.last_params = params
+        self.plot_current_signal()
+
+    def refresh_slider_labels(self):
+        sliders = [(self.amp1_label, "Amplitude", self.amp1_var), (self.freq1_label, "Frequency", self.freq1_var)]
+        if self.signal2_frame is not None:
+            sliders += [(self.amp2_label, "Amplitude", self.amp2_var), (self.freq2_label, "Frequency", self.freq2_var)]
+        if self.samples_frame is not None:
+            sliders.append((self.samples_label, "Number of Samples", self.samples_var))
+        for label, text, var in sliders:
+            format_spec = "{:.0f}" if isinstance(var, IntVar) else "{:.2f}"
+            label.config(text=f"{text}: {format_spec.format(var.get())}")
+
+    def param_symbol(self, operation):
+        if operation in FILTER_OPERATIONS:
+            return "f₀" if operation == "Band-pass Filter" else "f_c"
+        return {"Time Scaling": "a", "Amplitude Scaling": "A", "Time Shifting": "t₀"}[operation]
+
+    def compute_overlay(self, params, values):
+        # Every variant of the current operation in one batched evaluation
+        # over the shared input; row i of the results belongs to values[i].
+        operation = params["operation"]
+        num_points = params["samples"] if params["is_discrete"] else 500
+        t_input = np.linspace(0, 1, num_points)
+        s1 = self.generate_signal(params["signal_type"], t_input, params["amp1"], params["freq1"], params["phase1"])
+        column = values[:, None]
+        t_processed = t_input
+        processed = s1
+
+        if operation == "Time Scaling":
+            scalable = column > 1e-9
+            t_processed = np.where(scalable, t_input / np.where(scalable, column, 1.0), t_input)
+            val_at_zero = self.generate_signal(params["signal_type"], np.zeros(1), params["amp1"], params["freq1"], params["phase1"])[0]
+            processed = np.where(scalable, s1, val_at_zero)
+        elif operation == "Amplitude Scaling":
+            processed = column * s1
+        elif operation == "Time Shifting":
+            t_processed = t_input + column
+        elif operation in FILTER_OPERATIONS:
+            processed = self.apply_filter(operation, s1, t_input, column)
+
+        shape = (len(values), num_points)
+        return t_input, s1, np.broadcast_to(t_processed, shape), np.broadcast_to(processed, shape), None
+
+    def compute_signals(self, params):
         operation = params["operation"]
         is_discrete = params["is_discrete"]
         num_points = params["samples"] if is_discrete else 500
@@ -392,9 +646,14 @@ class SignalGUI:
         elif operation == "Amplitude Scaling":
             processed = params["param"] * s1
 
-        self.plot_signals(t_input, s1, t_processed, processed, s2, is_discrete)
+        elif operation in FILTER_OPERATIONS:
+            processed = self.apply_filter(operation, s1, t_input, params["param"])
+
+        return t_input, s1, t_processed, processed, s2
 
-    def plot_signals(self, t_input, s1, t_processed, processed, s2=None, is_discrete=False):
+    def plot_signals(self, t_input, s1, t_processed, processed, s2=None, is_discrete=False, labels=None):
+        # With ``labels``, t_processed and processed hold one overlaid trace per row.
+        self.ensure_plot_area()
         ax = self.axs
         ax.clear()
 
@@ -410,22 +669,43 @@ class SignalGUI:
         def plot_or_stem(ax, x_data, y_data, color, label, style='-', linewidth=1.5):
             if is_discrete:
                 markerline, stemlines, baseline = ax.stem(x_data, y_data, label=label, basefmt=" ")
-                plt.setp(markerline, 'color', color)
+                setp(markerline, 'color', color)
                 if style == '--':
-                    plt.setp(stemlines, 'color', color, linestyle='dashed', linewidth=linewidth)
+                    setp(stemlines, 'color', color, linestyle='dashed', linewidth=linewidth)
                 else:
-                    plt.setp(stemlines, 'color', color, linewidth=linewidth)
+                    setp(stemlines, 'color', color, linewidth=linewidth)
             else:
                 ax.plot(x_data, y_data, color=color, linewidth=linewidth, label=label, linestyle=style)
 
         plot_or_stem(ax, t_input, s1, self.theme["SIGNAL1_COLOR"], label="Signal 1")
         if s2 is not None:
             plot_or_stem(ax, t_input, s2, self.theme["SIGNAL2_COLOR"], label="Signal 2")
-        plot_or_stem(ax, t_processed, processed, self.theme["RESULT_COLOR"], label="Processed", style='-', linewidth=3)
+        overlay_handles = []
+        if labels is None:
+            plot_or_stem(ax, t_processed, processed, self.theme["RESULT_COLOR"], label="Processed", style='-', linewidth=3)
+        else:
+            # One collection for all traces keeps drawing cheap with dozens of
+            # them; discrete traces are drawn as markers only.
+            colors = matplotlib.colormaps["cool"](np.linspace(0, 1, len(labels)))
+            points = np.stack([t_processed, processed], axis=-1)
+            if is_discrete:
+                ax.scatter(points[..., 0].ravel(), points[..., 1].ravel(), s=16,
+                           c=np.repeat(colors, points.shape[1], axis=0))
+                overlay_handles = [Line2D([], [], color=color, marker="o", markersize=4, linestyle="", label=label)
+                                   for color, label in zip(colors, labels)]
+            else:
+                ax.add_collection(LineCollection(points, colors=colors, linewidths=2))
+                overlay_handles = [Line2D([], [], color=color, linewidth=2, label=label) for color, label in zip(colors, labels)]
+
+        def autoscale():
+            # relim() only sees lines, so the overlay collection is added back.
+            ax.relim()
+            if labels is not None:
+                ax.update_datalim(points.reshape(-1, 2))
+            ax.autoscale_view()
 
         # Autoscale initially to fit the data
-        ax.relim()
-        ax.autoscale_view()
+        autoscale()
 
         # Add some padding
         xlim = ax.get_xlim()
@@ -435,7 +715,9 @@ class SignalGUI:
         ax.set_xlim(xlim[0] - x_range * 0.05, xlim[1] + x_range * 0.05)
         ax.set_ylim(ylim[0] - y_range * 0.1, ylim[1] + y_range * 0.1)
 
-        ax.legend(facecolor=self.theme["PANEL_COLOR"], edgecolor=self.theme["ACCENT_COLOR"], labelcolor=self.theme["TEXT_COLOR"])
+        handles = ax.get_legend_handles_labels()[0] + overlay_handles
+        ax.legend(handles=handles, ncol=1 + len(handles) // 12, fontsize="small" if len(handles) > 6 else None,
+                  facecolor=self.theme["PANEL_COLOR"], edgecolor=self.theme["ACCENT_COLOR"], labelcolor=self.theme["TEXT_COLOR"])
 
         operation = self.operation_type.get()
         param = self.param_var.get()
@@ -443,7 +725,9 @@ class SignalGUI:
         if operation == "Time Scaling": info_text += f"Factor (a): {param:.2f}"
         elif operation == "Amplitude Scaling": info_text += f"Amplitude (A): {param:.2f}"
         elif operation == "Time Shifting": info_text += f"Shift (t₀): {param:.2f}"
+        elif operation in FILTER_OPERATIONS: info_text += f"{self.filter_param_name(operation)}: {self.filter_cutoff(operation, t_input, param):.2f} Hz"
         else: info_text = f"Operation: {operation}"
+        if labels is not None: info_text = f"Operation: {operation}\nOverlay: {len(labels)} traces"
 
         ax.text(0.98, 0.98, info_text, transform=ax.transAxes, fontsize=11,
                 verticalalignment='top', horizontalalignment='right',
@@ -451,6 +735,14 @@ class SignalGUI:
 
         self.figure.tight_layout()
 
+        self.measured_signals = [("Signal 1", t_input, s1)]
+        if s2 is not None:
+            self.measured_signals.append(("Signal 2", t_input, s2))
+        if labels is None:
+            self.measured_signals.append(("Processed", t_processed, processed))
+        else:
+            self.measured_signals.extend(zip(labels, t_processed, processed))
+
         # --- ZOOM/PAN/HOVER REWORK ---
 
         # Clean up previous hover label and reset button if they exist
@@ -466,8 +758,7 @@ class SignalGUI:
         self.drag_start = None
 
         # Store initial limits for reset
-        ax.relim()
-        ax.autoscale_view()
+        autoscale()
         self._initial_xlim = ax.get_xlim()
         self._initial_ylim = ax.get_ylim()
 
@@ -495,6 +786,7 @@ class SignalGUI:
                 ax.set_xlim(xlim0[0] - x_axis_move, xlim0[1] - x_axis_move)
                 ax.set_ylim(ylim0[0] - y_axis_move, ylim0[1] - y_axis_move)
                 self.canvas_plot.draw()
+                self.update_measurements()
 
             # --- Hover Label Logic ---
             elif not self._dragging:
@@ -509,8 +801,14 @@ class SignalGUI:
                         idx2 = np.abs(t_input - x).argmin()
                         text_lines.append(f"S2: (x={t_input[idx2]:.2f}, y={s2[idx2]:.2f})")
 
-                    idx_p = np.abs(t_processed - x).argmin()
-                    text_lines.append(f"Proc: (x={t_processed[idx_p]:.2f}, y={processed[idx_p]:.2f})")
+                    if labels is None:
+                        idx_p = np.abs(t_processed - x).argmin()
+                        text_lines.append(f"Proc: (x={t_processed[idx_p]:.2f}, y={processed[idx_p]:.2f})")
+                    else:
+                        rows = np.arange(len(labels))
+                        idx_p = np.abs(t_processed - x).argmin(axis=1)
+                        for label, tx, py in zip(labels, t_processed[rows, idx_p], processed[rows, idx_p]):
+                            text_lines.append(f"{label}: (x={tx:.2f}, y={py:.2f})")
 
                     self.hover_label.config(text="\n".join(text_lines))
                     # Place the label slightly offset from the cursor to avoid overlap
@@ -547,11 +845,13 @@ class SignalGUI:
             ax.set_xlim([xdata - new_width * (1 - relx), xdata + new_width * relx])
             ax.set_ylim([ydata - new_height * (1 - rely), ydata + new_height * rely])
             self.canvas_plot.draw()
+            self.update_measurements()
 
         def reset_zoom():
             ax.set_xlim(self._initial_xlim)
             ax.set_ylim(self._initial_ylim)
             self.canvas_plot.draw()
+            self.update_measurements()
 
         # Disconnect all previous event handlers to prevent duplicates
         for cid in getattr(self, 'event_cids', []):
@@ -570,23 +870,31 @@ class SignalGUI:
         self.reset_zoom_btn.place(relx=1.0, rely=1.0, x=-5, y=-5, anchor="se")
 
         self.canvas_plot.draw()
+        self.update_measurements()
+
+    def update_measurements(self):
+        xlim = self.axs.get_xlim()
+        blocks = []
+        for name, t, samples in self.measured_signals[:MEASUREMENT_ENTRIES]:
+            m = measure(samples, t, xlim)
+            freq = f"{m.frequency:.2f} Hz" if m.frequency is not None else "—"
+            blocks.append(f"{name}\n"
+                          f"  RMS {m.rms:7.3f}  Mean  {m.mean:7.3f}\n"
+                          f"  P-P {m.peak_to_peak:7.3f}  Power {m.power:7.3f}\n"
+                          f"  Energy {m.energy:.3f}  ZC {m.zero_crossings}\n"
+                          f"  f₀ {freq}")
+        rest = self.measured_signals[MEASUREMENT_ENTRIES:]
+        if rest:
+            rms = [measure(samples, t, xlim).rms for _, t, samples in rest]
+            blocks.append(f"+{len(rest)} more traces\n"
+                          f"  RMS {min(rms):.3f} – {max(rms):.3f}")
+        self.measurements_label.config(text="\n".join(blocks))
 
     def generate_signal(self, sig_type, t, amp, freq, phase=0):
-        phase_rad = np.deg2rad(phase)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            if sig_type == "Sine": return amp * np.sin(2 * np.pi * freq * t + phase_rad)
-            elif sig_type == "Square": return amp * np.sign(np.sin(2 * np.pi * freq * t + phase_rad))
-            elif sig_type == "Sawtooth": return amp * (2 * (freq * t - np.floor(0.5 + freq * t)))
-            elif sig_type == "Step": return amp * np.heaviside(t, 1)
-            elif sig_type == "Impulse":
-                arr = np.zeros_like(t)
-                idx = np.abs(t).argmin()
-                arr[idx] = amp
-                return arr
-            elif sig_type == "Ramp": return amp * t
-        return np.zeros_like(t)
+        return generate_signal(sig_type, t, amp, freq, phase)
 
     def save_main_plot(self):
+        self.ensure_plot_area()
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
             filetypes=[("PNG files", "*.png"), ("All files", "*.*")],
@@ -609,6 +917,7 @@ class SignalGUI:
         is_discrete = params["is_discrete"]
         num_points = params["samples"] if is_discrete else 500
 
+        self.ensure_plot_area()
         win = tk.Toplevel(self.master)
         win.title("All Signals")
         win.configure(bg=self.theme["BG_COLOR"])
@@ -631,13 +940,14 @@ class SignalGUI:
         def plot_or_stem(ax, x_data, y_data, color):
             if is_discrete:
                 markerline, stemlines, baseline = ax.stem(x_data, y_data, basefmt=" ")
-                plt.setp(markerline, 'color', color)
-                plt.setp(stemlines, 'color', color)
+                setp(markerline, 'color', color)
+                setp(stemlines, 'color', color)
             else:
                 ax.plot(x_data, y_data, color=color, linewidth=2)
 
         if operation in ["Signal Addition", "Signal Multiplication"]:
-            fig, axs = plt.subplots(3, 1, figsize=(8, 8))
+            fig = Figure(figsize=(8, 8))
+            axs = fig.subplots(3, 1)
             s2 = self.generate_signal(params["signal2_type"], t_input, params["amp2"], params["freq2"], params["phase2"])
             processed = s1 + s2 if operation == "Signal Addition" else s1 * s2
 
@@ -648,7 +958,8 @@ class SignalGUI:
             setup_ax(axs[2], "Resultant Signal", self.theme["RESULT_COLOR"])
             plot_or_stem(axs[2], t_input, processed, self.theme["RESULT_COLOR"])
         else:
-            fig, axs = plt.subplots(2, 1, figsize=(8, 6))
+            fig = Figure(figsize=(8, 6))
+            axs = fig.subplots(2, 1)
             t_output = t_input
             processed = s1
             title2 = "Processed Signal"
@@ -665,6 +976,9 @@ class SignalGUI:
             elif operation == "Amplitude Scaling":
                 processed = params["param"] * s1
                 title2 = "Amplitude-Scaled Signal"
+            elif operation in FILTER_OPERATIONS:
+                processed = self.apply_filter(operation, s1, t_input, params["param"])
+                title2 = "Filtered Signal"
 
             setup_ax(axs[0], "Original Signal", self.theme["SIGNAL1_COLOR"])
             plot_or_stem(axs[0], t_input, s1, self.theme["SIGNAL1_COLOR"])
@@ -711,6 +1025,63 @@ class SignalGUI:
         self.last_params = self.get_current_params()
         self.plot_current_signal()
 
+    def save_session(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".npz",
+            filetypes=[("WaveLab sessions", "*.npz"), ("All files", "*.*")],
+            title="Save Session As..."
+        )
+        if not file_path:
+            return
+        include_results = messagebox.askyesno("Save Session", "Also save the computed signals, so they open without recomputing?")
+        self.commit_history()
+        saved = []
+        same_file = self.session is not None and \
+            os.path.normcase(os.path.abspath(self.session.path)) == os.path.normcase(os.path.abspath(file_path))
+        if self.session is not None and include_results:
+            saved = [(key, self.session.result(key)) for key in self.session.result_keys() if key not in self.results]
+        if same_file:
+            # A file that is still mapped cannot be replaced on Windows, so
+            # bring the saved arrays into memory and let go of the maps first,
+            # including the ones held by the current plot.
+            saved = [(key, tuple(None if a is None else np.array(a) for a in signals)) for key, signals in saved]
+            for key, signals in saved:
+                self.results.put(key, signals)
+            self.session = None
+            if self.last_operation is not None:
+                self.plot_current_signal()
+            gc.collect()
+        results = None
+        if include_results:
+            results = self.results.items() + [(key, signals) for key, signals in saved if key not in self.results]
+        try:
+            save_session(file_path, self.get_current_params(), self.history, results)
+            messagebox.showinfo("Save Successful", f"Session saved to:\n{file_path}")
+        except Exception as e:
+            messagebox.showerror("Save Error", f"An error occurred while saving the session:\n{e}")
+        if same_file:
+            # Saved or not, the file is a complete session; map it again.
+            self.session = load_session(file_path)
+
+    def load_session(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("WaveLab sessions", "*.npz"), ("All files", "*.*")],
+            title="Open Session"
+        )
+        if not file_path:
+            return
+        try:
+            session = load_session(file_path)
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Could not open the session:\n{e}")
+            return
+        # Saved results stay on disk; plot_current_signal() maps them in when
+        # their parameters are shown.
+        self.session = session
+        self.results = ResultStore(maxsize=RESULT_STORE_SIZE)
+        self.history.load_state(*session.history_state)
+        self.restore_snapshot(session.snapshot)
+
     def run(self):
         self.master.mainloop()
 
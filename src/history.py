@@ -0,0 +1,96 @@
+from collections import OrderedDict, deque
+
+# Order of the entries of SignalGUI.get_current_params() inside a snapshot.
+PARAM_KEYS = ("signal_type", "amp1", "freq1", "phase1", "signal2_type", "amp2", "freq2", "phase2",
+              "operation", "param", "is_discrete", "samples")
+
+
+def params_to_snapshot(params):
+    return tuple(params[key] for key in PARAM_KEYS)
+
+def snapshot_to_params(snapshot):
+    return dict(zip(PARAM_KEYS, snapshot))
+
+
+class ParameterHistory:
+    """Bounded undo/redo history of parameter snapshots.
+
+    Snapshots are the small tuples made by params_to_snapshot(); the oldest
+    ones fall off once ``maxlen`` is exceeded.
+    """
+
+    def __init__(self, maxlen=100):
+        self.current = None
+        self._undo = deque(maxlen=maxlen)
+        self._redo = deque(maxlen=maxlen)
+
+    def record(self, snapshot):
+        # Make ``snapshot`` current; returns False if nothing changed.
+        if snapshot == self.current:
+            return False
+        if self.current is not None:
+            self._undo.append(self.current)
+        self.current = snapshot
+        self._redo.clear()
+        return True
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        if not self._undo:
+            return None
+        self._redo.append(self.current)
+        self.current = self._undo.pop()
+        return self.current
+
+    def redo(self):
+        if not self._redo:
+            return None
+        self._undo.append(self.current)
+        self.current = self._redo.pop()
+        return self.current
+
+    def state(self):
+        # (undo stack oldest first, current, redo stack oldest first)
+        return list(self._undo), self.current, list(self._redo)
+
+    def load_state(self, undo, current, redo):
+        self._undo.clear()
+        self._undo.extend(undo)
+        self.current = current
+        self._redo.clear()
+        self._redo.extend(redo)
+
+
+class ResultStore:
+    """Least-recently-used store of computed results, keyed by snapshot."""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def items(self):
+        # Least recently used first.
+        return list(self._items.items())
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
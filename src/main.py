@@ -1,9 +1,33 @@
-import tkinter as tk
-from gui import SignalGUI
+import argparse
 
-def main():
-    root = tk.Tk()
-    app = SignalGUI(root)
+from utils import StartupTimer, add_server_arguments
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="WaveLab signals and systems explorer")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="print the time spent in each startup phase")
+    parser.add_argument("--serve", action="store_true",
+                        help="run the signal-processing server instead of the GUI")
+    add_server_arguments(parser, suffix=" (with --serve)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.serve:
+        from server import run_server
+        run_server(args.host, args.port, args.path, args.workers, args.cache_size)
+        return
+
+    timer = StartupTimer(enabled=args.startup_timing)
+
+    with timer.phase("import tkinter"):
+        import tkinter as tk
+    with timer.phase("create root window"):
+        root = tk.Tk()
+    with timer.phase("import gui"):
+        from gui import SignalGUI
+    app = SignalGUI(root, timer=timer)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+import numpy as np
+
+
+class SignalMeasurement:
+    """Running RMS, mean, peak-to-peak, energy, zero crossings and frequency.
+
+    Samples are fed with update() one block at a time; each block is reduced
+    in a single vectorized pass and only a handful of scalars are carried
+    over, so the cost per block does not depend on how much came before.
+    ``dt`` is the sample spacing used for energy and frequency.
+    """
+
+    def __init__(self, dt=1.0):
+        self.dt = dt
+        self.count = 0
+        self.total = 0.0
+        self.sum_squares = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.zero_crossings = 0
+        self.rising_crossings = 0
+        self._first_rise = None
+        self._last_rise = None
+        self._last_sample = None
+
+    def update(self, block):
+        block = np.asarray(block, dtype=float)
+        if block.size == 0:
+            return self
+        self.total += block.sum()
+        self.sum_squares += np.dot(block, block)
+        self.minimum = min(self.minimum, block.min())
+        self.maximum = max(self.maximum, block.max())
+
+        positive = block >= 0
+        changed = positive[1:] != positive[:-1]
+        self.zero_crossings += int(np.count_nonzero(changed))
+        rises = np.flatnonzero(changed & positive[1:])
+        # Interpolate where the signal passes upward through zero.
+        positions = self.count + rises + block[rises] / (block[rises] - block[rises + 1])
+
+        # The crossing, if any, between the previous block and this one.
+        if self._last_sample is not None and (self._last_sample >= 0) != positive[0]:
+            self.zero_crossings += 1
+            if positive[0]:
+                boundary = self.count - 1 + self._last_sample / (self._last_sample - block[0])
+                positions = np.concatenate(([boundary], positions))
+
+        if len(positions):
+            if self._first_rise is None:
+                self._first_rise = positions[0]
+            self._last_rise = positions[-1]
+            self.rising_crossings += len(positions)
+
+        self._last_sample = block[-1]
+        self.count += len(block)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def power(self):
+        return self.sum_squares / self.count if self.count else 0.0
+
+    @property
+    def rms(self):
+        return np.sqrt(self.power)
+
+    @property
+    def energy(self):
+        return self.sum_squares * self.dt
+
+    @property
+    def peak_to_peak(self):
+        return self.maximum - self.minimum if self.count else 0.0
+
+    @property
+    def frequency(self):
+        # Fundamental estimated from the spacing of upward zero crossings;
+        # None until two of them have been seen.
+        if self.rising_crossings < 2 or self._last_rise == self._first_rise:
+            return None
+        return (self.rising_crossings - 1) / ((self._last_rise - self._first_rise) * self.dt)
+
+
+def visible_slice(t, xlim):
+    # Index range of the samples of ``t`` lying inside ``xlim``; works for
+    # ascending or descending time axes.
+    lo, hi = min(xlim), max(xlim)
+    if len(t) > 1 and t[0] > t[-1]:
+        reversed_t = t[::-1]
+        start = len(t) - np.searchsorted(reversed_t, hi, side="right")
+        stop = len(t) - np.searchsorted(reversed_t, lo, side="left")
+    else:
+        start = np.searchsorted(t, lo, side="left")
+        stop = np.searchsorted(t, hi, side="right")
+    return slice(int(start), int(stop))
+
+def measure(samples, t, xlim=None, block_size=None):
+    # Measurements of ``samples`` (taken at times ``t``), restricted to the
+    # x-range ``xlim`` if given. The visible range is a view, not a copy.
+    samples = np.asarray(samples)
+    t = np.asarray(t)
+    dt = abs(t[1] - t[0]) if len(t) > 1 else 1.0
+    if xlim is not None:
+        samples = samples[visible_slice(t, xlim)]
+    measurement = SignalMeasurement(dt)
+    block_size = block_size or max(len(samples), 1)
+    for start in range(0, len(samples), block_size):
+        measurement.update(samples[start:start + block_size])
+    return measurement
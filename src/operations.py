@@ -1,27 +1,126 @@
-def time_scaling(signal, scaling_factor):
-    # Implement time scaling operation
-    pass
+from fractions import Fraction
+from math import ceil, gcd
+
+import numpy as np
+
+# Zero crossings of the anti-alias filter kept on each side, per input sample.
+RESAMPLE_HALF_TAPS = 10
+
+# Minimum number of polyphase branches, i.e. fractional shifts resolve to
+# 1/RESAMPLE_SHIFT_STEPS of a sample.
+RESAMPLE_SHIFT_STEPS = 32
+
+# Outputs per polyphase branch computed in one vectorized block.
+RESAMPLE_BLOCK_SIZE = 4096
+
+
+def polyphase_filter(up, down, half_taps=RESAMPLE_HALF_TAPS):
+    # Kaiser-windowed sinc low-pass for resampling by up/down, reshaped to
+    # (up, taps_per_phase) so row p holds the taps of polyphase branch p.
+    # The cutoff follows the lower of the two rates, so compressing a signal
+    # (down > up) also removes content the output grid cannot represent.
+    max_rate = max(up, down)
+    half_len = half_taps * max_rate
+    n = np.arange(-half_len, half_len + 1)
+    taps = np.sinc(n / max_rate) * np.kaiser(len(n), 5.0) * (up / max_rate)
+    taps = np.pad(taps, (0, -len(taps) % up))
+    return taps.reshape(-1, up).T, half_len
+
+def resample_poly(signal, up, down, offset=0, num_out=None, block_size=RESAMPLE_BLOCK_SIZE):
+    # Resample by the rational factor up/down with a polyphase FIR filter.
+    # Output n is the filtered upsampled signal at index n * down + offset,
+    # so ``offset`` (in upsampled samples) shifts the output grid. Samples
+    # outside the input are treated as zero.
+    #
+    # Outputs n = r, r + P, r + 2P, ... (P = up / gcd(up, down)) all use the
+    # same filter branch and read input windows a fixed stride apart, so each
+    # branch is a strided sliding-window view times one tap vector, computed
+    # in blocks without materialising the upsampled signal.
+    x = np.asarray(signal, dtype=float)
+    up, down, offset = int(up), int(down), int(offset)
+    if up < 1 or down < 1:
+        raise ValueError("Resampling factors must be positive integers.")
+    if num_out is None:
+        num_out = ceil(x.shape[-1] * up / down)
+
+    phases, center = polyphase_filter(up, down)
+    taps_per_phase = phases.shape[1]
+    length = x.shape[-1]
+    out = np.zeros(x.shape[:-1] + (num_out,))
+
+    # Only outputs whose window overlaps the input can be non-zero.
+    shift = offset + center
+    first = max(0, -(shift // down))
+    last = min(num_out - 1, ((length + taps_per_phase - 1) * up - 1 - shift) // down)
+    if last < first:
+        return out
+
+    pad = [(0, 0)] * (x.ndim - 1) + [(taps_per_phase - 1, taps_per_phase)]
+    windows = np.lib.stride_tricks.sliding_window_view(np.pad(x, pad), taps_per_phase, axis=-1)
+    period = up // gcd(up, down)
+    stride = down // gcd(up, down)
+
+    for n0 in range(first, min(first + period, last + 1)):
+        q = n0 * down + shift
+        taps = phases[q % up, ::-1]
+        count = (last - n0) // period + 1
+        for k0 in range(0, count, block_size):
+            k1 = min(k0 + block_size, count)
+            j0 = q // up + k0 * stride
+            rows = windows[..., j0:j0 + (k1 - k0 - 1) * stride + 1:stride, :]
+            start = n0 + k0 * period
+            out[..., start:start + (k1 - k0 - 1) * period + 1:period] = rows @ taps
+    return out
+
+def resampling_ratio(scaling_factor, max_denominator=1000):
+    # (up, down) with down / up approximating the scaling factor and up large
+    # enough for sub-sample shifts.
+    if scaling_factor < 1 / max_denominator:
+        # Smaller factors would round to 0 (or need an enormous filter).
+        raise ValueError(f"Scaling factor must be at least 1/{max_denominator}.")
+    ratio = Fraction(scaling_factor).limit_denominator(max_denominator)
+    down, up = ratio.numerator, ratio.denominator
+    steps = ceil(RESAMPLE_SHIFT_STEPS / up)
+    return up * steps, down * steps
+
+def transform_to_grid(signal, scale=1.0, shift=0.0, sample_rate=1.0, num_out=None, max_denominator=1000):
+    # Samples of x(scale * t - shift) on the input's own grid t = n / sample_rate,
+    # so transformed signals can be combined sample by sample with others.
+    if scale <= 0:
+        raise ValueError("Scaling factor must be positive.")
+    x = np.asarray(signal, dtype=float)
+    if num_out is None:
+        num_out = x.shape[-1]
+    up, down = resampling_ratio(scale, max_denominator)
+    offset = -round(shift * sample_rate * up)
+    g = gcd(gcd(up, down), offset)
+    return resample_poly(x, up // g, down // g, offset // g, num_out)
+
+def time_scaling(signal, scaling_factor, max_denominator=1000):
+    # x(at) on the same sample grid as x(t)
+    return transform_to_grid(signal, scale=scaling_factor, max_denominator=max_denominator)
 
 def amplitude_scaling(signal, scaling_factor):
     # Implement amplitude scaling operation
     pass
 
-def time_shifting(signal, shift_amount):
-    # Implement time shifting operation
-    pass
+def time_shifting(signal, shift_amount, sample_rate=1.0):
+    # x(t - t0) on the same sample grid as x(t); shift_amount is in seconds
+    # (or samples with the default sample rate) and may be fractional.
+    return transform_to_grid(signal, shift=shift_amount, sample_rate=sample_rate)
 
 def time_reversal(signal):
     # Implement time reversal operation
     pass
 
 def signal_addition(signal1, signal2):
-    # Element-wise addition of two signals (lists)
+    # Element-wise addition of two signals
     if len(signal1) != len(signal2):
         raise ValueError("Signals must be of the same length for addition.")
-    return [a + b for a, b in zip(signal1, signal2)]
+    return np.add(signal1, signal2)
 
 def signal_multiplication(signal1, signal2):
-    # Element-wise multiplication of two signals (lists)
+    # Element-wise multiplication of two signals
     if len(signal1) != len(signal2):
         raise ValueError("Signals must be of the same length for multiplication.")
-    return [a * b for a, b in zip(signal1, signal2)]
\ No newline at end of file
+    return np.multiply(signal1, signal2)
@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import io
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from signals import OPERATIONS, SIGNAL_TYPES
+from sweep import DEFAULT_PARAMS, SWEEP_PARAMETERS, evaluate_operation, time_axis
+from themes import DARK_THEME
+from utils import add_server_arguments
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+# Latency samples kept per endpoint for percentile reporting.
+LATENCY_WINDOW = 4096
+
+MAX_BODY_BYTES = 1 << 16
+
+# Largest "samples" a request may ask for; beyond this a single request
+# could exhaust a worker's memory and break the process pool.
+MAX_SAMPLES = 1 << 20
+
+
+def normalize_params(params):
+    # Fill defaults and coerce types so equal requests produce equal keys.
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    normalized = dict(DEFAULT_PARAMS)
+    normalized.update(params)
+    for name in SWEEP_PARAMETERS:
+        normalized[name] = float(normalized[name])
+    normalized["is_discrete"] = bool(normalized["is_discrete"])
+    normalized["samples"] = int(normalized["samples"])
+    if normalized["operation"] not in OPERATIONS:
+        raise ValueError(f"Unsupported operation: {normalized['operation']}")
+    for name in ("signal_type", "signal2_type"):
+        if normalized[name] not in SIGNAL_TYPES:
+            raise ValueError(f"Unsupported signal type: {normalized[name]}")
+    if not normalized["is_discrete"]:
+        # Continuous plots always use 500 points; a fixed value keeps the
+        # cache key independent of the unused setting.
+        normalized["samples"] = DEFAULT_PARAMS["samples"]
+    elif not 2 <= normalized["samples"] <= MAX_SAMPLES:
+        raise ValueError(f"samples must be between 2 and {MAX_SAMPLES}")
+    return normalized
+
+def compute_samples(params):
+    # Processed samples on the grid linspace(0, 1, n) as raw .npy bytes.
+    buffer = io.BytesIO()
+    np.save(buffer, evaluate_operation(params, time_axis(params)))
+    return buffer.getvalue()
+
+def render_png(params):
+    from matplotlib.figure import Figure
+    from signals import generate_signal
+
+    t = time_axis(params)
+    fig = Figure(figsize=(6, 4))
+    fig.patch.set_facecolor(DARK_THEME["PANEL_COLOR"])
+    ax = fig.subplots(1, 1)
+    ax.set_facecolor(DARK_THEME["PANEL_COLOR"])
+    ax.grid(True, linestyle='--', alpha=0.3, color=DARK_THEME["ACCENT_COLOR"])
+    ax.plot(t, generate_signal(params["signal_type"], t, params["amp1"], params["freq1"], params["phase1"]),
+            color=DARK_THEME["SIGNAL1_COLOR"], linewidth=1.5, label="Signal 1")
+    if params["operation"] in ["Signal Addition", "Signal Multiplication"]:
+        ax.plot(t, generate_signal(params["signal2_type"], t, params["amp2"], params["freq2"], params["phase2"]),
+                color=DARK_THEME["SIGNAL2_COLOR"], linewidth=1.5, label="Signal 2")
+    ax.plot(t, evaluate_operation(params, t), color=DARK_THEME["RESULT_COLOR"], linewidth=3, label="Processed")
+    ax.set_title(params["operation"], color=DARK_THEME["ACCENT_COLOR"])
+    ax.legend()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", facecolor=fig.get_facecolor())
+    return buffer.getvalue()
+
+ENDPOINTS = {
+    "/samples": (compute_samples, "application/octet-stream"),
+    "/plot": (render_png, "image/png"),
+}
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, elapsed, ok):
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.latencies.append(elapsed)
+
+    def summary(self, uptime):
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": self.requests / uptime if uptime > 0 else 0.0,
+            "latency_ms": {
+                "mean": float(latencies.mean()),
+                "p50": float(np.percentile(latencies, 50)),
+                "p95": float(np.percentile(latencies, 95)),
+                "max": float(latencies.max()),
+            },
+        }
+
+
+class SignalServer:
+    """Serves signal samples and plots over HTTP/1.1 on loopback or a Unix socket.
+
+    Identical requests that arrive while one is being computed share that
+    computation, recent results are kept in an LRU cache, and all number
+    crunching runs in ``executor`` so the event loop only does I/O.
+    """
+
+    def __init__(self, cache_size=128, workers=None, executor=None):
+        self.cache_size = cache_size
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers)
+        self._owns_executor = executor is None
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._server = None
+        self.started = time.perf_counter()
+        self.stats = {path: EndpointStats() for path in list(ENDPOINTS) + ["/stats"]}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        if self._owns_executor:
+            # A ProcessPoolExecutor forks its workers on first use. Doing that
+            # before listening keeps client sockets out of the children, which
+            # would otherwise hold connections open after they are closed here.
+            await asyncio.wrap_future(self.executor.submit(int))
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.started = time.perf_counter()
+        return self._server
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    async def result(self, endpoint, params):
+        params = normalize_params(params)
+        key = (endpoint, json.dumps(params, sort_keys=True))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.cache_misses += 1
+            task = asyncio.ensure_future(self._compute(endpoint, key, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _compute(self, endpoint, key, params):
+        compute, _ = ENDPOINTS[endpoint]
+        data = await asyncio.get_running_loop().run_in_executor(self.executor, compute, params)
+        self._cache[key] = data
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return data
+
+    def stats_summary(self):
+        uptime = time.perf_counter() - self.started
+        return {
+            "uptime_s": uptime,
+            "endpoints": {path: stats.summary(uptime) for path, stats in self.stats.items()},
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "coalesced": self.coalesced,
+                "size": len(self._cache),
+            },
+        }
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as e:
+                    writer.write(self._response(400, "text/plain", str(e).encode(), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                start = time.perf_counter()
+                status, content_type, payload = await self._dispatch(method, path, body)
+                if path in self.stats:
+                    self.stats[path].record(time.perf_counter() - start, status == 200)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(self._response(status, content_type, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise ConnectionError("Malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise ValueError("Invalid Content-Length")
+        if length < 0:
+            raise ValueError("Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise ConnectionError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0], headers, body
+
+    async def _dispatch(self, method, path, body):
+        if path == "/stats":
+            if method != "GET":
+                return 405, "text/plain", b"Use GET"
+            return 200, "application/json", json.dumps(self.stats_summary()).encode()
+        if path not in ENDPOINTS:
+            return 404, "text/plain", b"Unknown endpoint"
+        if method != "POST":
+            return 405, "text/plain", b"Use POST with a JSON parameter set"
+        try:
+            params = json.loads(body or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("Body must be a JSON object")
+            data = await self.result(path, params)
+        except (ValueError, TypeError) as e:
+            return 400, "text/plain", str(e).encode()
+        except Exception as e:
+            return 500, "text/plain", str(e).encode()
+        return 200, ENDPOINTS[path][1], data
+
+    def _response(self, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return head.encode("latin-1") + payload
+
+
+async def serve(host="127.0.0.1", port=8765, path=None, workers=None, cache_size=128):
+    server = SignalServer(cache_size=cache_size, workers=workers)
+    await server.start(host, port, path)
+    where = path or f"http://{host}:{server.port}"
+    print(f"WaveLab server listening on {where}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(json.dumps(server.stats_summary(), indent=2))
+        await server.close()
+
+def run_server(host="127.0.0.1", port=8765, path=None, workers=None, cache_size=128):
+    try:
+        asyncio.run(serve(host, port, path, workers, cache_size))
+    except KeyboardInterrupt:
+        pass
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="WaveLab signal-processing server")
+    add_server_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_server(args.host, args.port, args.path, args.workers, args.cache_size)
@@ -0,0 +1,190 @@
+import json
+import os
+import struct
+import tempfile
+import zipfile
+
+import numpy as np
+
+from history import PARAM_KEYS, params_to_snapshot, snapshot_to_params
+from signals import OPERATIONS, SIGNAL_TYPES
+
+SESSION_VERSION = 1
+
+# Name of the uint8 member holding the JSON metadata.
+METADATA_MEMBER = "session"
+
+# Names of the arrays in a SignalGUI.compute_signals() result.
+RESULT_FIELDS = ("t_input", "s1", "t_processed", "processed", "s2")
+
+# Size of a zip local file header before its name and extra field.
+LOCAL_HEADER_SIZE = 30
+
+
+def save_session(path, params, history=None, results=None):
+    # Write the current params, the undo/redo history and, optionally, the
+    # (snapshot, compute_signals() result) pairs in ``results`` to ``path``.
+    #
+    # The file is an uncompressed np.savez archive, so np.load() can read it,
+    # and every array sits in the file as a plain .npy that load_session()
+    # can memory-map. Arrays shared between fields (t_processed is often
+    # t_input itself) are stored once.
+    arrays = {}
+    stored = {}
+    entries = []
+    for snapshot, signals in results or ():
+        names = []
+        for field, array in zip(RESULT_FIELDS, signals):
+            if array is None:
+                names.append(None)
+                continue
+            if id(array) not in stored:
+                name = f"result{len(entries)}_{field}"
+                arrays[name] = np.asarray(array)
+                stored[id(array)] = name
+            names.append(stored[id(array)])
+        entries.append({"snapshot": list(snapshot), "arrays": names})
+
+    undo, current, redo = history.state() if history is not None else ([], None, [])
+    metadata = {
+        "version": SESSION_VERSION,
+        "params": params,
+        "history": {
+            "undo": [list(s) for s in undo],
+            "current": list(current) if current is not None else None,
+            "redo": [list(s) for s in redo],
+        },
+        "results": entries,
+    }
+    arrays[METADATA_MEMBER] = np.frombuffer(json.dumps(metadata).encode("utf-8"), dtype=np.uint8)
+    # Write beside the target and swap it in, so a session whose arrays are
+    # still mapped from ``path`` is never truncated underneath them. Passing
+    # a file object also stops np.savez from appending ".npz" to the name.
+    fd, temp_path = tempfile.mkstemp(suffix=".npz", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        # mkstemp creates the file owner-only; give it the mode open() would.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def _check_params(params):
+    # Raise ValueError unless ``params`` is a complete get_current_params()
+    # dict the GUI can restore.
+    if not isinstance(params, dict) or set(params) != set(PARAM_KEYS):
+        raise ValueError("Session parameters are incomplete.")
+    if params["operation"] not in OPERATIONS:
+        raise ValueError(f"Unsupported operation: {params['operation']}")
+    for name in ("signal_type", "signal2_type"):
+        if params[name] not in SIGNAL_TYPES:
+            raise ValueError(f"Unsupported signal type: {params[name]}")
+    for name in ("amp1", "freq1", "phase1", "amp2", "freq2", "phase2", "param"):
+        if isinstance(params[name], bool) or not isinstance(params[name], (int, float)):
+            raise ValueError(f"Session parameter {name} must be a number.")
+    if not isinstance(params["is_discrete"], bool) or isinstance(params["samples"], bool) \
+            or not isinstance(params["samples"], int):
+        raise ValueError("Session sampling parameters are invalid.")
+
+def _snapshot(values):
+    if not isinstance(values, list) or len(values) != len(PARAM_KEYS):
+        raise ValueError("Session history is malformed.")
+    _check_params(snapshot_to_params(values))
+    return tuple(values)
+
+def _member_offsets(path):
+    # Map each .npy member of an uncompressed archive to (dtype, shape,
+    # fortran_order, data offset in the file).
+    offsets = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED or not info.filename.endswith(".npy"):
+                raise ValueError(f"Session member {info.filename} cannot be memory-mapped.")
+            # The central directory's extra field can differ from the local
+            # one, so the data offset is read from the local header.
+            f.seek(info.header_offset)
+            header = f.read(LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"Session member {info.filename} holds Python objects.")
+            offsets[info.filename[:-4]] = (dtype, shape, fortran_order, f.tell())
+    return offsets
+
+
+class Session:
+    """A session file opened by load_session().
+
+    Only the metadata is read up front. array() and result() memory-map
+    the stored arrays on first use, so pages are read from disk only when a
+    plot or measurement actually touches them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = _member_offsets(path)
+        self._arrays = {}
+        if METADATA_MEMBER not in self._offsets:
+            raise ValueError("Not a WaveLab session file.")
+        try:
+            metadata = json.loads(self.array(METADATA_MEMBER).tobytes().decode("utf-8"))
+            if metadata.get("version") != SESSION_VERSION:
+                raise ValueError(f"Unsupported session version: {metadata.get('version')}")
+            _check_params(metadata["params"])
+            history = metadata["history"]
+            history_state = ([_snapshot(s) for s in history["undo"]],
+                             _snapshot(history["current"]) if history["current"] is not None else None,
+                             [_snapshot(s) for s in history["redo"]])
+            results = {}
+            for entry in metadata["results"]:
+                names = entry["arrays"]
+                if len(names) != len(RESULT_FIELDS) or any(n is not None and n not in self._offsets for n in names):
+                    raise ValueError("Session results refer to missing arrays.")
+                results[_snapshot(entry["snapshot"])] = names
+        except (AttributeError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed session metadata: {e!r}") from e
+        self.params = metadata["params"]
+        self.history_state = history_state
+        self._results = results
+
+    @property
+    def snapshot(self):
+        return params_to_snapshot(self.params)
+
+    def result_keys(self):
+        return list(self._results)
+
+    def __contains__(self, snapshot):
+        return snapshot in self._results
+
+    def array(self, name):
+        if name not in self._arrays:
+            if name not in self._offsets:
+                raise KeyError(name)
+            dtype, shape, fortran_order, offset = self._offsets[name]
+            if 0 in shape:
+                self._arrays[name] = np.empty(shape, dtype)
+            else:
+                self._arrays[name] = np.memmap(self.path, dtype=dtype, mode="r", offset=offset,
+                                               shape=shape, order="F" if fortran_order else "C")
+        return self._arrays[name]
+
+    def result(self, snapshot):
+        # The stored compute_signals() result for ``snapshot``, or None.
+        names = self._results.get(snapshot)
+        if names is None:
+            return None
+        return tuple(None if name is None else self.array(name) for name in names)
+
+
+def load_session(path):
+    return Session(path)
@@ -1,4 +1,7 @@
 import numpy as np
+
+from filters import FILTER_OPERATIONS
+
 class Signal:
     def __init__(self, amplitude=1, frequency=1, phase=0):
         self.amplitude = amplitude
@@ -32,4 +35,31 @@ def create_signal(signal_type, amplitude=1, frequency=1, phase=0):
     elif signal_type == 'sawtooth':
         return SawtoothSignal(amplitude, frequency, phase)
     else:
-        raise ValueError("Unsupported signal type")
\ No newline at end of file
+        raise ValueError("Unsupported signal type")
+
+SIGNAL_TYPES = ("Sine", "Square", "Sawtooth", "Step", "Impulse", "Ramp")
+
+# Every operation the GUI offers and sweep.evaluate_operation() understands.
+OPERATIONS = ("Time Scaling", "Amplitude Scaling", "Time Shifting", "Time Reversal",
+              "Signal Addition", "Signal Multiplication") + tuple(FILTER_OPERATIONS)
+
+
+def generate_signal(sig_type, t, amp, freq, phase=0):
+    # Samples of one of the SIGNAL_TYPES at times t (phase in degrees).
+    # Parameters broadcast against t, so a column of amplitudes or
+    # frequencies yields one row of samples per value.
+    t = np.asarray(t, dtype=float)
+    phase_rad = np.deg2rad(phase)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if sig_type == "Sine": return amp * np.sin(2 * np.pi * freq * t + phase_rad)
+        elif sig_type == "Square": return amp * np.sign(np.sin(2 * np.pi * freq * t + phase_rad))
+        elif sig_type == "Sawtooth": return amp * (2 * (freq * t - np.floor(0.5 + freq * t)))
+        elif sig_type == "Step": return amp * np.heaviside(t, 1)
+        elif sig_type == "Impulse":
+            shape = np.broadcast_shapes(t.shape, np.shape(amp))
+            arr = np.zeros(shape)
+            idx = np.abs(np.broadcast_to(t, shape)).argmin(axis=-1)[..., None]
+            np.put_along_axis(arr, idx, np.take_along_axis(np.broadcast_to(amp, shape), idx, axis=-1), axis=-1)
+            return arr
+        elif sig_type == "Ramp": return amp * t
+    return np.zeros_like(t)
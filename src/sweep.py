@@ -0,0 +1,175 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from filters import FILTER_OPERATIONS, filter_operation
+from signals import generate_signal
+
+# Numeric entries of SignalGUI.get_current_params() that can be swept.
+SWEEP_PARAMETERS = ("amp1", "freq1", "phase1", "amp2", "freq2", "phase2", "param")
+
+DEFAULT_PARAMS = {
+    "signal_type": "Sine",
+    "amp1": 1.0,
+    "freq1": 1.0,
+    "phase1": 0.0,
+    "signal2_type": "Sine",
+    "amp2": 1.0,
+    "freq2": 1.0,
+    "phase2": 0.0,
+    "operation": "Time Scaling",
+    "param": 1.0,
+    "is_discrete": False,
+    "samples": 50,
+}
+
+# Upper bound on samples evaluated per vectorized call, to cap temporaries.
+BATCH_ELEMENTS = 1 << 20
+
+# Grids smaller than this many samples are computed in-process.
+MIN_PARALLEL_ELEMENTS = 1 << 22
+
+
+class _ResultMemory(shared_memory.SharedMemory):
+    """Shared memory that is never explicitly unmapped.
+
+    SharedMemory.close() unmaps the segment even while NumPy arrays built on
+    ``buf`` still point into it. Here only the descriptor is closed; the
+    mapping goes away when the last array referencing it is collected.
+    """
+
+    def __del__(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class SweepResult:
+    """Processed samples for every point of a parameter grid.
+
+    ``values`` has one axis per swept parameter (in ``dims`` order) followed
+    by the time axis; ``coords`` maps each dim, and ``"t"``, to its values.
+    """
+
+    def __init__(self, values, dims, coords):
+        self.values = values
+        self.dims = dims
+        self.coords = coords
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def sel(self, **params):
+        # Samples for the grid point whose coordinates equal ``params``.
+        index = []
+        for dim in self.dims:
+            matches = np.flatnonzero(self.coords[dim] == params[dim])
+            if len(matches) == 0:
+                raise KeyError(f"{dim}={params[dim]} is not on the sweep grid")
+            index.append(matches[0])
+        return self.values[tuple(index)]
+
+
+def time_axis(params):
+    num_points = params["samples"] if params["is_discrete"] else 500
+    return np.linspace(0, 1, num_points)
+
+def evaluate_operation(params, t):
+    # Processed signal for ``params`` sampled on the common grid ``t``.
+    # Numeric parameters may be arrays that broadcast against ``t``.
+    operation = params["operation"]
+    signal1 = (params["signal_type"], params["amp1"], params["freq1"], params["phase1"])
+
+    if operation == "Time Scaling":
+        return generate_signal(signal1[0], params["param"] * t, *signal1[1:])
+    elif operation == "Amplitude Scaling":
+        return params["param"] * generate_signal(signal1[0], t, *signal1[1:])
+    elif operation == "Time Shifting":
+        return generate_signal(signal1[0], t - params["param"], *signal1[1:])
+    elif operation == "Time Reversal":
+        return generate_signal(signal1[0], -t, *signal1[1:])
+    elif operation in ["Signal Addition", "Signal Multiplication"]:
+        s1 = generate_signal(signal1[0], t, *signal1[1:])
+        s2 = generate_signal(params["signal2_type"], t, params["amp2"], params["freq2"], params["phase2"])
+        return s1 + s2 if operation == "Signal Addition" else s1 * s2
+    elif operation in FILTER_OPERATIONS:
+        sample_rate = (t.shape[-1] - 1) / (t[..., -1] - t[..., 0])
+        return filter_operation(operation, generate_signal(signal1[0], t, *signal1[1:]), params["param"], sample_rate)
+    raise ValueError(f"Unsupported operation: {operation}")
+
+def _fill_cases(out, start, stop, params, dims, axes, t):
+    # Evaluate flat grid cases [start, stop) into rows of ``out``.
+    grid_shape = tuple(len(axis) for axis in axes)
+    batch = max(1, BATCH_ELEMENTS // len(t))
+    for lo in range(start, stop, batch):
+        hi = min(lo + batch, stop)
+        index = np.unravel_index(np.arange(lo, hi), grid_shape)
+        case_params = dict(params)
+        for dim, axis, idx in zip(dims, axes, index):
+            case_params[dim] = axis[idx][:, None]
+        out[lo:hi] = np.broadcast_to(evaluate_operation(case_params, t), (hi - lo, len(t)))
+
+def _sweep_worker(shm_name, shape, dtype, start, stop, params, dims, axes):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _fill_cases(out, start, stop, params, dims, axes, time_axis(params))
+        del out
+    finally:
+        shm.close()
+
+def parameter_sweep(grid, base_params=None, workers=None, dtype=np.float64):
+    """Evaluate the current operation over the Cartesian product of ``grid``.
+
+    ``grid`` maps names from SWEEP_PARAMETERS to sequences of values; all
+    other settings come from ``base_params`` (a get_current_params() dict).
+    Large grids are split across a process pool whose workers write straight
+    into one shared-memory result array, so no sample data is pickled.
+    """
+    params = dict(DEFAULT_PARAMS)
+    params.update(base_params or {})
+    unknown = [name for name in grid if name not in SWEEP_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Cannot sweep over: {', '.join(unknown)}")
+
+    dims = tuple(grid)
+    axes = [np.asarray(grid[dim], dtype=float).ravel() for dim in dims]
+    if any(len(axis) == 0 for axis in axes):
+        raise ValueError("Every swept parameter needs at least one value.")
+    t = time_axis(params)
+    grid_shape = tuple(len(axis) for axis in axes)
+    num_cases = int(np.prod(grid_shape))
+    flat_shape = (num_cases, len(t))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, num_cases)
+
+    if workers <= 1 or num_cases * len(t) < MIN_PARALLEL_ELEMENTS:
+        values = np.empty(flat_shape, dtype=dtype)
+        _fill_cases(values, 0, num_cases, params, dims, axes, t)
+    else:
+        # The result is returned as a view of the segment the workers wrote,
+        # rather than copied out of it.
+        nbytes = int(np.prod(flat_shape)) * np.dtype(dtype).itemsize
+        shm = _ResultMemory(create=True, size=nbytes)
+        try:
+            # A few chunks per worker keeps the pool busy when cases differ in cost.
+            bounds = np.linspace(0, num_cases, min(num_cases, workers * 4) + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_sweep_worker, shm.name, flat_shape, np.dtype(dtype).str,
+                                       int(lo), int(hi), params, dims, axes)
+                           for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+                for future in futures:
+                    future.result()
+            values = np.ndarray(flat_shape, dtype=dtype, buffer=shm.buf)
+        finally:
+            # The name is no longer needed; the mapping stays valid.
+            shm.unlink()
+
+    coords = {dim: axis for dim, axis in zip(dims, axes)}
+    coords["t"] = t
+    return SweepResult(values.reshape(grid_shape + (len(t),)), dims, coords)
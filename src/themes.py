@@ -0,0 +1,18 @@
+# Colour themes shared by the GUI and the headless plot renderer; kept free
+# of tkinter so the server can use them.
+
+# Neon Dark Theme (unchanged)
+NEON_DARK_THEME = {
+    "BG_COLOR": "#101014",
+    "PANEL_COLOR": "#181820",
+    "ACCENT_COLOR": "#C9E819",
+    "TEXT_COLOR": "#00FFFF",
+    "BTN_COLOR": "#53C4F1",
+    "BTN_TEXT_COLOR": "#101014",
+    "SIGNAL1_COLOR": "#B4C6F5",
+    "SIGNAL2_COLOR": "#F9CC98",
+    "RESULT_COLOR": "#39FF14",
+    "SLIDER_BG": "#222233",
+}
+
+DARK_THEME = NEON_DARK_THEME
@@ -1,3 +1,8 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
 def plot_signal(time, signal, title="Signal", xlabel="Time", ylabel="Amplitude"):
     import matplotlib.pyplot as plt
     
@@ -18,4 +23,49 @@ def validate_signal_input(signal):
 
 def generate_time_vector(start, end, step):
     import numpy as np
-    return np.arange(start, end, step)
\ No newline at end of file
+    return np.arange(start, end, step)
+
+
+class StartupTimer:
+    """Records how long each named startup phase takes.
+
+    Disabled timers still run the wrapped code but record nothing, so callers
+    can wrap phases unconditionally.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self, stream=None):
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        width = max((len(name) for name, _ in self.phases), default=5)
+        print("WaveLab startup timing:", file=stream)
+        for name, elapsed in self.phases:
+            print(f"  {name:<{width}}  {elapsed * 1000:8.1f} ms", file=stream)
+        total = time.perf_counter() - self._origin
+        print(f"  {'total':<{width}}  {total * 1000:8.1f} ms", file=stream)
+
+
+def add_server_arguments(parser, suffix=""):
+    # Options of the signal-processing server, shared by server.py and
+    # main.py --serve. ``suffix`` is appended to the help texts.
+    parser.add_argument("--host", default="127.0.0.1", help="server address" + suffix)
+    parser.add_argument("--port", type=int, default=8765, help="server port" + suffix)
+    parser.add_argument("--unix-socket", dest="path", help="listen on a Unix socket instead of TCP" + suffix)
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)" + suffix)
+    parser.add_argument("--cache-size", type=int, default=128, help="number of results to keep" + suffix)
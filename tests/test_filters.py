@@ -0,0 +1,106 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from filters import FIRFilter, SOSFilter, band_edges, butterworth_sos, filter_in_chunks, filter_operation, fir_design
+
+
+def direct_form(sos, x):
+    # Reference biquad cascade, one sample at a time.
+    y = np.array(x, dtype=float)
+    for b0, b1, b2, _, a1, a2 in sos:
+        out = np.zeros_like(y)
+        x1 = x2 = y1 = y2 = 0.0
+        for n, value in enumerate(y):
+            out[n] = b0 * value + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x2, x1, y2, y1 = x1, value, y1, out[n]
+        y = out
+    return y
+
+
+class TestFilters(unittest.TestCase):
+
+    def setUp(self):
+        self.fs = 500.0
+        self.x = np.random.default_rng(0).standard_normal(3001)
+
+    def test_sos_matches_direct_form(self):
+        for kind, cutoff in (("lowpass", 30.0), ("highpass", 5.0), ("bandpass", (10.0, 40.0))):
+            sos = butterworth_sos(kind, cutoff, self.fs, order=6)
+            np.testing.assert_allclose(SOSFilter(sos).process(self.x), direct_form(sos, self.x), atol=1e-10)
+
+    def test_sos_state_carries_between_blocks(self):
+        sos = butterworth_sos("lowpass", 30.0, self.fs)
+        filt = SOSFilter(sos)
+        parts = [filt.process(part) for part in np.split(self.x, [1, 2, 100, 1000, 1064])]
+        np.testing.assert_allclose(np.concatenate(parts), SOSFilter(sos).process(self.x), atol=1e-12)
+
+    def test_fir_matches_convolution(self):
+        taps = fir_design("lowpass", 30.0, self.fs)
+        filt = FIRFilter(taps)
+        parts = [filt.process(part) for part in np.split(self.x, [7, 8, 2000])]
+        np.testing.assert_allclose(np.concatenate(parts), np.convolve(self.x, taps)[:len(self.x)], atol=1e-12)
+
+    def test_channels_are_independent(self):
+        channels = np.stack([self.x, 2 * self.x, -self.x])
+        sos = butterworth_sos("highpass", 10.0, self.fs)
+        filtered = SOSFilter(sos).process(channels)
+        np.testing.assert_allclose(filtered[1], 2 * SOSFilter(sos).process(self.x), atol=1e-12)
+
+    def test_frequency_response(self):
+        t = np.arange(5000) / self.fs
+        passband, stopband = np.sin(2 * np.pi * 5 * t), np.sin(2 * np.pi * 100 * t)
+        for filt in (SOSFilter(butterworth_sos("lowpass", 30.0, self.fs)), FIRFilter(fir_design("lowpass", 30.0, self.fs))):
+            self.assertGreater(np.abs(filt.process(passband)[2000:]).max(), 0.95)
+            filt.reset()
+            self.assertLess(np.abs(filt.process(stopband)[2000:]).max(), 0.01)
+
+    def test_bandpass_edges_are_half_power(self):
+        def gain(sos, frequency):
+            z = np.exp(-2j * np.pi * frequency / self.fs)
+            return abs(np.prod([(b0 + b1 * z + b2 * z * z) / (1 + a1 * z + a2 * z * z)
+                                for b0, b1, b2, _, a1, a2 in sos]))
+
+        for centre in (20.0, 60.0):
+            low, high = band_edges("bandpass", centre)
+            for order in (2, 4, 8):
+                sos = butterworth_sos("bandpass", (low, high), self.fs, order)
+                self.assertAlmostEqual(gain(sos, low), np.sqrt(0.5), places=6)
+                self.assertAlmostEqual(gain(sos, high), np.sqrt(0.5), places=6)
+                self.assertGreater(gain(sos, centre), 0.99)
+        # A band wide enough that the prototype's real pole stays real.
+        sos = butterworth_sos("bandpass", (2.0, 200.0), self.fs, 6)
+        self.assertAlmostEqual(gain(sos, 2.0), np.sqrt(0.5), places=6)
+        self.assertAlmostEqual(gain(sos, 200.0), np.sqrt(0.5), places=6)
+
+    def test_filter_in_chunks(self):
+        sos = butterworth_sos("lowpass", 30.0, self.fs)
+        chunked = filter_in_chunks(SOSFilter(sos), self.x, chunk_size=700)
+        np.testing.assert_allclose(chunked, SOSFilter(sos).process(self.x), atol=1e-12)
+
+    def test_filter_operation_per_row_cutoffs(self):
+        rows = filter_operation("Low-pass Filter", self.x, np.array([[10.0], [40.0]]), self.fs)
+        self.assertEqual(rows.shape, (2, len(self.x)))
+        np.testing.assert_allclose(rows[1], filter_operation("Low-pass Filter", self.x, 40.0, self.fs))
+
+    def test_per_channel_coefficients(self):
+        # One input, three designs: one pass gives each design's output, also
+        # when fed in pieces that mix the block and sample-by-sample paths.
+        designs = [butterworth_sos("lowpass", 20.0, self.fs), butterworth_sos("highpass", 5.0, self.fs),
+                   butterworth_sos("bandpass", (10.0, 40.0), self.fs)]
+        filt = SOSFilter(np.stack(designs))
+        parts = [filt.process(part) for part in np.split(self.x, [5, 200, 1000])]
+        expected = [SOSFilter(sos).process(self.x) for sos in designs]
+        np.testing.assert_allclose(np.concatenate(parts, axis=-1), expected, atol=1e-10)
+
+    def test_rejects_cutoff_above_nyquist(self):
+        with self.assertRaises(ValueError):
+            butterworth_sos("lowpass", 300.0, self.fs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from history import PARAM_KEYS, ParameterHistory, ResultStore, params_to_snapshot, snapshot_to_params
+from sweep import DEFAULT_PARAMS
+
+
+class TestParameterHistory(unittest.TestCase):
+
+    def test_undo_redo(self):
+        history = ParameterHistory()
+        for snapshot in ("a", "b", "c"):
+            history.record(snapshot)
+        self.assertEqual(history.undo(), "b")
+        self.assertEqual(history.undo(), "a")
+        self.assertIsNone(history.undo())
+        self.assertEqual(history.redo(), "b")
+        self.assertEqual(history.current, "b")
+
+    def test_record_clears_redo(self):
+        history = ParameterHistory()
+        history.record("a")
+        history.record("b")
+        history.undo()
+        history.record("c")
+        self.assertFalse(history.can_redo())
+        self.assertEqual(history.undo(), "a")
+
+    def test_duplicate_is_not_recorded(self):
+        history = ParameterHistory()
+        self.assertTrue(history.record("a"))
+        self.assertFalse(history.record("a"))
+        self.assertFalse(history.can_undo())
+
+    def test_history_is_bounded(self):
+        history = ParameterHistory(maxlen=3)
+        for snapshot in range(10):
+            history.record(snapshot)
+        undone = [history.undo() for _ in range(4)]
+        self.assertEqual(undone, [8, 7, 6, None])
+
+    def test_snapshot_round_trip(self):
+        snapshot = params_to_snapshot(DEFAULT_PARAMS)
+        self.assertEqual(len(snapshot), len(PARAM_KEYS))
+        self.assertEqual(snapshot_to_params(snapshot), DEFAULT_PARAMS)
+
+
+class TestResultStore(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        store = ResultStore(maxsize=2)
+        store.put("a", 1)
+        store.put("b", 2)
+        store.get("a")
+        store.put("c", 3)
+        self.assertIn("a", store)
+        self.assertNotIn("b", store)
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("b"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from measurements import SignalMeasurement, measure, visible_slice
+
+
+class TestSignalMeasurement(unittest.TestCase):
+
+    def setUp(self):
+        self.t = np.linspace(0, 1, 1000, endpoint=False)
+        self.x = 1.5 * np.sin(2 * np.pi * 7 * self.t + 0.3) + 0.2
+
+    def test_single_block(self):
+        m = measure(self.x, self.t)
+        self.assertAlmostEqual(m.mean, 0.2, places=6)
+        self.assertAlmostEqual(m.rms, np.sqrt(1.5 ** 2 / 2 + 0.2 ** 2), places=6)
+        self.assertAlmostEqual(m.peak_to_peak, 3.0, places=3)
+        self.assertAlmostEqual(m.energy, np.sum(self.x ** 2) * 0.001)
+        self.assertEqual(m.zero_crossings, 14)
+        self.assertAlmostEqual(m.frequency, 7.0, places=3)
+
+    def test_blocks_match_single_pass(self):
+        whole = measure(self.x, self.t)
+        streamed = SignalMeasurement(dt=0.001)
+        for start in range(0, len(self.x), 37):
+            streamed.update(self.x[start:start + 37])
+        for name in ("count", "mean", "rms", "peak_to_peak", "zero_crossings", "frequency"):
+            self.assertAlmostEqual(getattr(streamed, name), getattr(whole, name), msg=name)
+
+    def test_frequency_needs_two_rising_crossings(self):
+        self.assertIsNone(measure(np.linspace(-1, 1, 50), np.linspace(0, 1, 50)).frequency)
+
+    def test_visible_range(self):
+        m = measure(self.x, self.t, xlim=(0.25, 0.5))
+        self.assertEqual(m.count, 251)
+
+    def test_visible_range_descending_axis(self):
+        t = -self.t
+        window = visible_slice(t, (-0.5, -0.25))
+        self.assertTrue(np.all((t[window] >= -0.5) & (t[window] <= -0.25)))
+        self.assertEqual(window.stop - window.start, 251)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+import numpy as np
 from src.signals import SineSignal, SquareSignal, SawtoothSignal
 from src.operations import time_scaling, amplitude_scaling, time_shifting, time_reversal, signal_addition, signal_multiplication
+from src.operations import resample_poly, transform_to_grid
 
 class TestSignalOperations(unittest.TestCase):
 
@@ -33,5 +35,53 @@ class TestSignalOperations(unittest.TestCase):
         multiplied_signal = signal_multiplication(self.signal1, self.signal2)
         self.assertEqual(len(multiplied_signal), 100)  # Assuming both signals have the same length
 
+class TestResampling(unittest.TestCase):
+
+    def setUp(self):
+        self.fs = 500.0
+        self.t = np.arange(2000) / self.fs
+        self.x = np.sin(2 * np.pi * 3 * self.t)
+
+    def test_time_scaling_stays_on_grid(self):
+        scaled = time_scaling(self.x, 2)
+        self.assertEqual(len(scaled), len(self.x))
+        np.testing.assert_allclose(scaled[50:900], np.sin(2 * np.pi * 6 * self.t[50:900]), atol=1e-3)
+        # x(2t) runs past the end of x in the second half of the grid
+        self.assertTrue(np.all(scaled[1100:] == 0))
+
+    def test_compression_removes_aliases(self):
+        tone = np.sin(2 * np.pi * 200 * self.t)
+        self.assertLess(np.abs(time_scaling(tone, 2)[50:900]).max(), 1e-2)
+
+    def test_fractional_time_shift(self):
+        shifted = time_shifting(self.x, 0.3013, self.fs)
+        expected = np.sin(2 * np.pi * 3 * (self.t - 0.3013))
+        np.testing.assert_allclose(shifted[200:1800], expected[200:1800], atol=1e-3)
+
+    def test_integer_shift_is_exact(self):
+        shifted = time_shifting(self.x, 10)
+        np.testing.assert_allclose(shifted[10:], self.x[:-10], atol=1e-12)
+
+    def test_composite_system(self):
+        y = np.cos(2 * np.pi * 2 * self.t)
+        combined = signal_addition(transform_to_grid(self.x, scale=2), time_shifting(y, 0.3, self.fs))
+        expected = np.sin(2 * np.pi * 6 * self.t) + np.cos(2 * np.pi * 2 * (self.t - 0.3))
+        np.testing.assert_allclose(combined[200:900], expected[200:900], atol=2e-3)
+
+    def test_resample_poly_channels(self):
+        channels = np.stack([self.x, 2 * self.x])
+        resampled = resample_poly(channels, 3, 2)
+        self.assertEqual(resampled.shape, (2, 3000))
+        np.testing.assert_allclose(resampled[1], 2 * resample_poly(self.x, 3, 2))
+
+    def test_rejects_non_positive_scale(self):
+        with self.assertRaises(ValueError):
+            time_scaling(self.x, 0)
+
+    def test_rejects_tiny_scale(self):
+        with self.assertRaisesRegex(ValueError, "at least 1/1000"):
+            time_scaling(self.x, 0.0004)
+        self.assertEqual(time_scaling(self.x, 0.001).shape, self.x.shape)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from server import MAX_SAMPLES, SignalServer, normalize_params
+from signals import generate_signal
+
+
+async def request(port, method, path, params=None, content_length=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(params).encode() if params is not None else b""
+    if content_length is None:
+        content_length = len(body)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                 f"Content-Length: {content_length}\r\n\r\n".encode() + body)
+    await writer.drain()
+    # Reading to EOF also checks that the server really closes the connection.
+    response = await asyncio.wait_for(reader.read(), timeout=30)
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), payload
+
+
+class TestSignalServer(unittest.TestCase):
+
+    def run_with_server(self, scenario, executor="thread"):
+        async def main():
+            if executor == "thread":
+                server = SignalServer(executor=ThreadPoolExecutor(max_workers=2))
+            else:
+                server = SignalServer(workers=2)
+            await server.start(port=0)
+            try:
+                return await scenario(server)
+            finally:
+                await server.close()
+        return asyncio.run(main())
+
+    def test_samples_returns_npy(self):
+        params = {"operation": "Amplitude Scaling", "param": 2.0, "freq1": 3.0}
+
+        async def scenario(server):
+            return await request(server.port, "POST", "/samples", params)
+
+        status, payload = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        samples = np.load(io.BytesIO(payload))
+        t = np.linspace(0, 1, 500)
+        np.testing.assert_allclose(samples, 2.0 * generate_signal("Sine", t, 1.0, 3.0))
+
+    def test_plot_returns_png(self):
+        async def scenario(server):
+            return await request(server.port, "POST", "/plot", {"operation": "Signal Addition"})
+
+        status, payload = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        self.assertTrue(payload.startswith(b"\x89PNG"))
+
+    def test_identical_requests_are_computed_once(self):
+        params = {"operation": "Time Shifting", "param": 0.25}
+
+        async def scenario(server):
+            responses = await asyncio.gather(*[request(server.port, "POST", "/samples", params) for _ in range(8)])
+            status, stats = await request(server.port, "GET", "/stats")
+            return responses, json.loads(stats)
+
+        responses, stats = self.run_with_server(scenario)
+        self.assertEqual(len({payload for _, payload in responses}), 1)
+        self.assertEqual(stats["cache"]["misses"], 1)
+        self.assertEqual(stats["cache"]["hits"] + stats["cache"]["coalesced"], 7)
+        self.assertEqual(stats["endpoints"]["/samples"]["requests"], 8)
+
+    def test_invalid_params_are_rejected(self):
+        async def scenario(server):
+            return await request(server.port, "POST", "/samples", {"signal_type": "Noise"})
+
+        status, _ = self.run_with_server(scenario)
+        self.assertEqual(status, 400)
+
+    def test_unknown_operation_is_rejected_up_front(self):
+        with self.assertRaises(ValueError):
+            normalize_params({"operation": "Convolution"})
+
+    def test_unused_samples_share_a_cache_entry(self):
+        self.assertEqual(normalize_params({"samples": 10}), normalize_params({"samples": 999}))
+        self.assertNotEqual(normalize_params({"samples": 10, "is_discrete": True}),
+                            normalize_params({"samples": 999, "is_discrete": True}))
+
+    def test_oversized_samples_are_rejected(self):
+        async def scenario(server):
+            return await request(server.port, "POST", "/samples", {"samples": MAX_SAMPLES + 1, "is_discrete": True})
+
+        status, _ = self.run_with_server(scenario)
+        self.assertEqual(status, 400)
+
+    def test_invalid_content_length_is_rejected(self):
+        async def scenario(server):
+            return [await request(server.port, "POST", "/samples", {}, content_length=length)
+                    for length in ("abc", "-5")]
+
+        for status, _ in self.run_with_server(scenario):
+            self.assertEqual(status, 400)
+
+    def test_default_process_pool(self):
+        # The first client on a fresh server must see the connection close.
+        params = {"operation": "Amplitude Scaling", "param": 2.0}
+
+        async def scenario(server):
+            first = await request(server.port, "POST", "/samples", params)
+            second = await request(server.port, "POST", "/plot", params)
+            return first, second
+
+        (status, payload), (plot_status, png) = self.run_with_server(scenario, executor="process")
+        self.assertEqual(status, 200)
+        np.testing.assert_allclose(np.load(io.BytesIO(payload)), 2.0 * generate_signal("Sine", np.linspace(0, 1, 500), 1.0, 1.0))
+        self.assertEqual(plot_status, 200)
+        self.assertTrue(png.startswith(b"\x89PNG"))
+
+    def test_plot_does_not_import_gui(self):
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        code = ("import sys; from server import normalize_params, render_png; "
+                "render_png(normalize_params({})); "
+                "sys.exit('tkinter' in sys.modules or 'gui' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], cwd=src, env=dict(os.environ, MPLBACKEND="Agg"))
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
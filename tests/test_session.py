@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from history import ParameterHistory, params_to_snapshot
+from session import load_session, save_session
+from sweep import DEFAULT_PARAMS
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".npz")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def make_result(self, params):
+        t = np.linspace(0, 1, 500)
+        s1 = params["amp1"] * np.sin(2 * np.pi * params["freq1"] * t)
+        return t, s1, t, 2 * s1, None
+
+    def test_params_and_history_round_trip(self):
+        history = ParameterHistory()
+        snapshots = [params_to_snapshot(dict(DEFAULT_PARAMS, amp1=amp)) for amp in (1.0, 2.0, 3.0)]
+        for snapshot in snapshots:
+            history.record(snapshot)
+        history.undo()
+        params = dict(DEFAULT_PARAMS, amp1=2.0)
+        save_session(self.path, params, history)
+
+        session = load_session(self.path)
+        self.assertEqual(session.params, params)
+        self.assertEqual(session.snapshot, snapshots[1])
+        self.assertEqual(session.result_keys(), [])
+        restored = ParameterHistory()
+        restored.load_state(*session.history_state)
+        self.assertEqual(restored.state(), history.state())
+        self.assertEqual(restored.redo(), snapshots[2])
+
+    def test_results_are_memory_mapped(self):
+        params = dict(DEFAULT_PARAMS, amp1=1.5, freq1=3.0)
+        snapshot = params_to_snapshot(params)
+        result = self.make_result(params)
+        save_session(self.path, params, ParameterHistory(), [(snapshot, result)])
+
+        session = load_session(self.path)
+        self.assertIn(snapshot, session)
+        loaded = session.result(snapshot)
+        self.assertIsNone(loaded[4])
+        for original, stored in zip(result[:4], loaded[:4]):
+            self.assertIsInstance(stored, np.memmap)
+            np.testing.assert_array_equal(stored, original)
+        # Shared arrays are written once and mapped once.
+        self.assertIs(loaded[0], loaded[2])
+        self.assertIsNone(session.result(params_to_snapshot(DEFAULT_PARAMS)))
+
+    def test_arrays_are_mapped_on_demand(self):
+        params = dict(DEFAULT_PARAMS)
+        snapshot = params_to_snapshot(params)
+        save_session(self.path, params, None, [(snapshot, self.make_result(params))])
+        session = load_session(self.path)
+        self.assertEqual(len(session._arrays), 1)
+        session.result(snapshot)
+        self.assertEqual(len(session._arrays), 4)
+
+    def test_readable_with_np_load(self):
+        params = dict(DEFAULT_PARAMS)
+        snapshot = params_to_snapshot(params)
+        result = self.make_result(params)
+        save_session(self.path, params, None, [(snapshot, result)])
+        with np.load(self.path) as archive:
+            np.testing.assert_array_equal(archive["result0_processed"], result[3])
+
+    def test_overwrite_while_mapped(self):
+        params = dict(DEFAULT_PARAMS)
+        snapshot = params_to_snapshot(params)
+        result = self.make_result(params)
+        save_session(self.path, params, None, [(snapshot, result)])
+        loaded = load_session(self.path).result(snapshot)
+        save_session(self.path, params)
+        np.testing.assert_array_equal(loaded[3], result[3])
+        self.assertEqual(load_session(self.path).result_keys(), [])
+
+    def test_file_mode_follows_umask(self):
+        umask = os.umask(0o022)
+        try:
+            save_session(self.path, dict(DEFAULT_PARAMS))
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def write_metadata(self, metadata):
+        encoded = np.frombuffer(json.dumps(metadata).encode("utf-8"), dtype=np.uint8)
+        with open(self.path, "wb") as f:
+            np.savez(f, session=encoded)
+
+    def test_rejects_invalid_metadata(self):
+        history = {"undo": [], "current": None, "redo": []}
+        missing_key = dict(DEFAULT_PARAMS)
+        del missing_key["samples"]
+        bad_snapshot = list(params_to_snapshot(dict(DEFAULT_PARAMS, operation="Convolution")))
+        cases = [
+            {"version": 1, "params": missing_key, "history": history, "results": []},
+            {"version": 1, "params": dict(DEFAULT_PARAMS, operation="Convolution"), "history": history, "results": []},
+            {"version": 1, "params": dict(DEFAULT_PARAMS, amp1="loud"), "history": history, "results": []},
+            {"version": 1, "params": dict(DEFAULT_PARAMS), "history": dict(history, undo=[bad_snapshot]), "results": []},
+            {"version": 1, "params": dict(DEFAULT_PARAMS), "history": history,
+             "results": [{"snapshot": list(params_to_snapshot(DEFAULT_PARAMS)), "arrays": ["missing"] * 5}]},
+            {"version": 1, "params": dict(DEFAULT_PARAMS)},
+        ]
+        for metadata in cases:
+            self.write_metadata(metadata)
+            with self.assertRaises(ValueError):
+                load_session(self.path)
+
+    def test_rejects_compressed_archives(self):
+        np.savez_compressed(self.path, session=np.zeros(3, dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            load_session(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import gc
+import mmap
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import sweep
+from signals import generate_signal
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    def test_grid_shape_and_coords(self):
+        result = sweep.parameter_sweep({"freq1": [1, 2, 3], "param": [0.5, 2.0]}, workers=1)
+        self.assertEqual(result.shape, (3, 2, 500))
+        self.assertEqual(result.dims, ("freq1", "param"))
+        np.testing.assert_array_equal(result.coords["param"], [0.5, 2.0])
+        self.assertEqual(len(result.coords["t"]), 500)
+
+    def test_matches_direct_evaluation(self):
+        result = sweep.parameter_sweep({"freq1": [2, 5], "param": [0.5, 3.0]},
+                                       {"operation": "Time Scaling", "phase1": 30.0}, workers=1)
+        t = result.coords["t"]
+        expected = generate_signal("Sine", 3.0 * t, 1.0, 5, 30.0)
+        np.testing.assert_allclose(result.sel(freq1=5, param=3.0), expected)
+
+    def test_unused_parameter_broadcasts(self):
+        result = sweep.parameter_sweep({"amp2": [1.0, 2.0]}, {"operation": "Time Reversal"}, workers=1)
+        np.testing.assert_array_equal(result.values[0], result.values[1])
+
+    def test_process_pool_matches_serial(self):
+        grid = {"amp1": np.linspace(0.5, 2.0, 6), "param": np.linspace(-1.0, 1.0, 7)}
+        base = {"operation": "Time Shifting", "signal_type": "Square"}
+        serial = sweep.parameter_sweep(grid, base, workers=1)
+        previous = sweep.MIN_PARALLEL_ELEMENTS
+        sweep.MIN_PARALLEL_ELEMENTS = 0
+        try:
+            parallel = sweep.parameter_sweep(grid, base, workers=2)
+        finally:
+            sweep.MIN_PARALLEL_ELEMENTS = previous
+        np.testing.assert_array_equal(parallel.values, serial.values)
+
+    def test_parallel_result_outlives_sweep(self):
+        # The result is backed by the workers' shared memory, not a copy.
+        previous = sweep.MIN_PARALLEL_ELEMENTS
+        sweep.MIN_PARALLEL_ELEMENTS = 0
+        try:
+            result = sweep.parameter_sweep({"amp1": [1.0, 2.0, 3.0]}, workers=2)
+        finally:
+            sweep.MIN_PARALLEL_ELEMENTS = previous
+        values = result.values[1:]
+        del result
+        gc.collect()
+        t = np.linspace(0, 1, 500)
+        np.testing.assert_allclose(values[1], generate_signal("Sine", t, 3.0, 1.0))
+        base = values
+        while isinstance(base, np.ndarray):
+            base = base.base
+        self.assertIsInstance(base, mmap.mmap)
+
+    def test_rejects_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            sweep.parameter_sweep({"signal_type": ["Sine"]})
+
+
+if __name__ == '__main__':
+    unittest.main()